@@ -145,11 +145,19 @@ class Analyzer(ABC):
     # Language name
     language: str = "unknown"
     
+    # Largest file (bytes) worth running this analyzer on; the registry
+    # reads it when the analyzer is registered
+    max_file_size: int = 1_048_576
+    
     @abstractmethod
     def analyze_file(self, file_path: Path, content: str) -> AnalysisResult:
         """Analyze a single file and extract knowledge."""
         pass
     
+    def analyze_into(self, file_path: Path, content: str, result: AnalysisResult) -> None:
+        """Analyze a single file, appending findings to an existing result."""
+        result.merge(self.analyze_file(file_path, content))
+    
     def can_handle(self, file_path: Path) -> bool:
         """Check if this analyzer can handle the given file."""
         return file_path.suffix.lower() in self.extensions
@@ -162,10 +170,11 @@ class Analyzer(ABC):
         )
         
         for file_path in dir_path.rglob("*"):
-            if not file_path.is_file():
-                continue
+            # Extension check first: it needs no syscall, is_file() does
             if not self.can_handle(file_path):
                 continue
+            if not file_path.is_file():
+                continue
             
             try:
                 content = file_path.read_text(encoding="utf-8", errors="ignore")
@@ -1,7 +1,12 @@
 """Analyzer registry for managing language-specific analyzers."""
 
+import hashlib
+import os
+import pickle
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Type
+from typing import Iterator, Sequence
 
 from rich.console import Console
 
@@ -9,24 +14,116 @@ from .base import Analyzer, AnalysisResult
 
 console = Console()
 
+# Serial analysis reads files on a small thread pool this many files ahead of
+# the analyzers, so disk waits overlap with parsing.
+READ_AHEAD_DEPTH = 32
+READ_AHEAD_THREADS = 4
+
+# Byte budget for memoizing analyzer output by file content, so vendored or
+# generated files repeated across repositories are only analyzed once. Off
+# by default: hashing and snapshotting every file costs more than it saves
+# on a single pass over distinct files.
+RESULT_CACHE_BYTES = 0
+
+
+def _file_result(file_path: Path) -> AnalysisResult:
+    """Create an empty result for a single file."""
+    parent = os.path.dirname(file_path) or "."
+    return AnalysisResult(repo_path=parent, repo_name=os.path.basename(parent))
+
+
+def _decode(content: str | bytes) -> str:
+    """Return file content as text.
+    
+    Decoded text gets universal newlines, as ``Path.read_text`` would give.
+    """
+    if isinstance(content, str):
+        return content
+    text = content.decode("utf-8", errors="ignore")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _output_lists(result: AnalysisResult) -> tuple[list, ...]:
+    """The lists an analyzer appends its output for a file to."""
+    return (
+        result.schemas,
+        result.dependencies,
+        result.business_logic,
+        result.apis,
+        result.data_flows,
+        result.errors,
+    )
+
+
+def _content_digest(content: str | bytes) -> bytes:
+    """Hash file content for the result cache."""
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    return hashlib.sha1(content, usedforsecurity=False).digest()
+
+
+def _replay(snapshot: bytes, cached_path: str, file_path: Path, result: AnalysisResult) -> None:
+    """Append a cached file result to *result*, re-pointed at *file_path*."""
+    cached: AnalysisResult = pickle.loads(snapshot)
+    path = str(file_path)
+    for items in (
+        cached.schemas,
+        cached.dependencies,
+        cached.business_logic,
+        cached.apis,
+        cached.data_flows,
+    ):
+        for item in items:
+            if item.source_file == cached_path:
+                item.source_file = path
+    cached.errors = [error.replace(cached_path, path) for error in cached.errors]
+    result.merge(cached)
+
+
+def _suffix(name: str) -> str:
+    """Return the lowercased extension of a file name, like ``Path.suffix``."""
+    dot = name.rfind(".")
+    if dot <= 0 or dot == len(name) - 1:
+        return ""
+    return name[dot:].lower()
+
 
 class AnalyzerRegistry:
     """Registry of available analyzers."""
     
-    def __init__(self):
+    def __init__(self, result_cache_bytes: int = RESULT_CACHE_BYTES):
         self._analyzers: dict[str, Analyzer] = {}
-        self._extension_map: dict[str, list[Analyzer]] = {}
+        self._extension_map: dict[str, tuple[Analyzer, ...]] = {}
+        # Per extension: largest file size any of its analyzers accepts
+        self._max_sizes: dict[str, int] = {}
+        # (content digest, analyzer language, file name) -> (path, pickled result),
+        # in LRU order. Snapshots are pickled so callers can annotate the
+        # findings they are handed without touching the cache.
+        self._result_cache: OrderedDict[tuple[bytes, str, str], tuple[str, bytes]] = OrderedDict()
+        self._result_cache_used = 0
+        self.result_cache_bytes = result_cache_bytes
+    
+    def __getstate__(self) -> dict:
+        # Pool workers get the analyzers, not the parent's cached results
+        state = self.__dict__.copy()
+        state["_result_cache"] = OrderedDict()
+        state["_result_cache_used"] = 0
+        return state
     
     def register(self, analyzer: Analyzer) -> None:
         """Register an analyzer."""
         self._analyzers[analyzer.language] = analyzer
         
+        # Buckets are rebuilt as tuples so lookups hand out immutable
+        # sequences that callers can iterate without copying.
         for ext in analyzer.extensions:
-            if ext not in self._extension_map:
-                self._extension_map[ext] = []
-            self._extension_map[ext].append(analyzer)
+            bucket = (*self._extension_map.get(ext, ()), analyzer)
+            self._extension_map[ext] = bucket
+            self._max_sizes[ext] = max(a.max_file_size for a in bucket)
     
-    def get_analyzers_for_file(self, file_path: Path) -> list[Analyzer]:
+    def get_analyzers_for_file(self, file_path: Path) -> Sequence[Analyzer]:
         """Get all analyzers that can handle a file."""
         ext = file_path.suffix.lower()
         return self._extension_map.get(ext, [])
@@ -35,22 +132,85 @@ class AnalyzerRegistry:
         """Get analyzer by language name."""
         return self._analyzers.get(language)
     
-    def analyze_file(self, file_path: Path, content: str) -> AnalysisResult:
+    def analyze_file(
+        self,
+        file_path: Path,
+        content: str | bytes,
+        analyzers: Sequence[Analyzer] | None = None,
+        size: int | None = None,
+    ) -> AnalysisResult:
         """Analyze a file with all applicable analyzers."""
-        result = AnalysisResult(
-            repo_path=str(file_path.parent),
-            repo_name=file_path.parent.name,
-        )
+        result = _file_result(file_path)
+        self.analyze_into(file_path, content, result, analyzers=analyzers, size=size)
+        return result
+    
+    def analyze_into(
+        self,
+        file_path: Path,
+        content: str | bytes,
+        result: AnalysisResult,
+        analyzers: Sequence[Analyzer] | None = None,
+        size: int | None = None,
+    ) -> None:
+        """Analyze a file with all applicable analyzers, appending to *result*.
+        
+        *content* may be the raw bytes of the file; it is decoded once, and
+        only if an analyzer actually runs on it. Callers that already
+        resolved the analyzers for the file's extension can pass them in to
+        skip the lookup. If the file *size* is given, analyzers whose
+        ``max_file_size`` it exceeds are skipped.
+        """
+        if analyzers is None:
+            analyzers = self.get_analyzers_for_file(file_path)
+        digest = _content_digest(content) if self.result_cache_bytes > 0 and analyzers else None
         
-        analyzers = self.get_analyzers_for_file(file_path)
+        # The try/except stays inline per analyzer: on 3.11+ it costs nothing
+        # unless an analyzer raises, whereas wrapping analyzers in an
+        # error-catching proxy would add a call frame per analyzer per file.
+        text = None
         for analyzer in analyzers:
+            if size is not None and size > analyzer.max_file_size:
+                continue
+            if text is None:
+                text = _decode(content)
+            if digest is None:
+                lists = _output_lists(result)
+                lengths = [len(items) for items in lists]
+                try:
+                    analyzer.analyze_into(file_path, text, result)
+                except Exception as e:
+                    # Like a failed analyze_file, keep none of its output
+                    for items, length in zip(lists, lengths):
+                        del items[length:]
+                    result.errors.append(f"{analyzer.language}: {e}")
+                continue
+            
+            key = (digest, analyzer.language, file_path.name)
+            cached = self._result_cache.get(key)
+            if cached is not None:
+                self._result_cache.move_to_end(key)
+                _replay(cached[1], cached[0], file_path, result)
+                continue
+            
+            file_result = _file_result(file_path)
             try:
-                file_result = analyzer.analyze_file(file_path, content)
-                result.merge(file_result)
+                analyzer.analyze_into(file_path, text, file_result)
             except Exception as e:
                 result.errors.append(f"{analyzer.language}: {e}")
-        
-        return result
+                continue
+            self._cache_result(key, str(file_path), file_result)
+            result.merge(file_result)
+    
+    def _cache_result(self, key: tuple[bytes, str, str], path: str, file_result: AnalysisResult) -> None:
+        """Snapshot *file_result* into the result cache, evicting LRU entries."""
+        snapshot = pickle.dumps(file_result, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(snapshot) > self.result_cache_bytes:
+            return
+        self._result_cache[key] = (path, snapshot)
+        self._result_cache_used += len(snapshot)
+        while self._result_cache_used > self.result_cache_bytes:
+            _, (_, evicted) = self._result_cache.popitem(last=False)
+            self._result_cache_used -= len(evicted)
     
     def analyze_repository(
         self,
@@ -58,54 +218,206 @@ class AnalyzerRegistry:
         skip_dirs: list[str] | None = None,
         include_extensions: list[str] | None = None,
         max_file_size: int = 1_048_576,
+        workers: int | None = 1,
     ) -> AnalysisResult:
-        """Analyze an entire repository."""
-        skip_dirs = set(skip_dirs or [])
+        """Analyze an entire repository.
+        
+        With ``workers`` greater than one (or ``None`` for one per CPU), files
+        are analyzed in a process pool and merged back in walk order.
+        """
+        skip_dirs = frozenset(skip_dirs or ())
+        include_suffixes = tuple(ext.lower() for ext in include_extensions or ())
+        root = str(repo_path)
+        # Walked paths are os.path.join(root, ...); slice off that prefix
+        # rather than calling Path.relative_to for every file.
+        prefix_len = len(os.path.join(root, ""))
         
         result = AnalysisResult(
-            repo_path=str(repo_path),
+            repo_path=root,
             repo_name=repo_path.name,
         )
         
-        for file_path in repo_path.rglob("*"):
-            # Skip directories in exclusion list
-            if any(skip in file_path.parts for skip in skip_dirs):
+        files = self._walk(root, skip_dirs, include_suffixes, max_file_size)
+        if workers is not None and workers <= 1:
+            self._analyze_serial(files, result, prefix_len)
+            return result
+        
+        outcomes = self._analyze_parallel(
+            [(path, size) for path, _, size in files], workers
+        )
+        for path, file_result, error in outcomes:
+            result.file_count += 1
+            if error is not None:
+                result.errors.append(f"{path}: {error}")
                 continue
-            
-            if not file_path.is_file():
+            result.merge(file_result)
+            result.analyzed_files.append(path[prefix_len:])
+        
+        return result
+    
+    def _analyze_parallel(
+        self,
+        files: list[tuple[str, int]],
+        workers: int | None,
+    ) -> Iterator[tuple[str, AnalysisResult | None, str | None]]:
+        """Analyze files in a process pool, yielding outcomes in input order."""
+        if not files:
+            return
+        with ProcessPoolExecutor(
+            max_workers=workers or os.cpu_count(),
+            initializer=_init_worker,
+            initargs=(self,),
+        ) as executor:
+            yield from executor.map(_analyze_in_worker, files, chunksize=32)
+    
+    def _analyze_serial(
+        self,
+        files: Iterator[tuple[str, Sequence[Analyzer], int]],
+        result: AnalysisResult,
+        prefix_len: int,
+    ) -> None:
+        """Analyze files in this process straight into *result*."""
+        for path, analyzers, size, content, error in self._iter_file_contents(files):
+            result.file_count += 1
+            if error is not None:
+                result.errors.append(f"{path}: {error}")
                 continue
-            
-            # Check extension filter
-            if include_extensions:
-                if file_path.suffix.lower() not in include_extensions:
-                    continue
-            
-            # Check file size
+            self.analyze_into(Path(path), content, result, analyzers=analyzers, size=size)
+            result.analyzed_files.append(path[prefix_len:])
+    
+    def _iter_file_contents(
+        self,
+        files: Iterator[tuple[str, Sequence[Analyzer], int]],
+    ) -> Iterator[tuple[str, Sequence[Analyzer], int, bytes | None, str | None]]:
+        """Read walked files, yielding ``(path, analyzers, size, content, error)``.
+        
+        Reads run on a small thread pool up to ``READ_AHEAD_DEPTH`` files
+        ahead of the consumer, so disk waits overlap with analysis while only
+        that many file contents are held in memory. Output is in walk order.
+        """
+        window: deque[tuple[str, Sequence[Analyzer], int, Future]] = deque()
+        with ThreadPoolExecutor(max_workers=READ_AHEAD_THREADS) as executor:
+            for path, analyzers, size in files:
+                pending = executor.submit(_read_bytes, path, size)
+                window.append((path, analyzers, size, pending))
+                if len(window) >= READ_AHEAD_DEPTH:
+                    yield _resolve_read(*window.popleft())
+            while window:
+                yield _resolve_read(*window.popleft())
+    
+    def _walk(
+        self,
+        root: str,
+        skip_dirs: frozenset[str],
+        include_suffixes: tuple[str, ...],
+        max_file_size: int,
+    ) -> Iterator[tuple[str, Sequence[Analyzer], int]]:
+        """Yield ``(path, analyzers, size)`` for files to analyze.
+        
+        Uses ``os.scandir`` so file type checks come from the cached dirent
+        data, prunes excluded directories before descending into them, and
+        only stats files whose extension an analyzer claims. Files larger
+        than every claiming analyzer's ``max_file_size`` are skipped.
+        """
+        stack = [root]
+        while stack:
             try:
-                if file_path.stat().st_size > max_file_size:
-                    continue
+                entries = os.scandir(stack.pop())
             except OSError:
                 continue
             
-            # Check if we have analyzers for this file
-            if not self.get_analyzers_for_file(file_path):
-                continue
-            
-            result.file_count += 1
-            
-            try:
-                content = file_path.read_text(encoding="utf-8", errors="ignore")
-                file_result = self.analyze_file(file_path, content)
-                result.merge(file_result)
-                result.analyzed_files.append(str(file_path.relative_to(repo_path)))
-            except Exception as e:
-                result.errors.append(f"{file_path}: {e}")
-        
-        return result
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in skip_dirs:
+                            stack.append(entry.path)
+                        continue
+                    
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+                    
+                    name = entry.name
+                    # endswith() on a tuple runs in C; lowercase only on a miss
+                    if include_suffixes and not (
+                        name.endswith(include_suffixes)
+                        or name.lower().endswith(include_suffixes)
+                    ):
+                        continue
+                    
+                    ext = _suffix(name)
+                    # Check if we have analyzers for this file before paying for a stat
+                    analyzers = self._extension_map.get(ext)
+                    if not analyzers:
+                        continue
+                    
+                    try:
+                        size = entry.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        continue
+                    if size > max_file_size or size > self._max_sizes[ext]:
+                        continue
+                    
+                    yield entry.path, analyzers, size
+
+
+# Registry copy held by each process-pool worker (see _init_worker)
+_worker_registry: AnalyzerRegistry | None = None
+
+
+def _init_worker(registry: AnalyzerRegistry) -> None:
+    """Install the parent's registry in a pool worker process."""
+    global _worker_registry
+    _worker_registry = registry
 
 
-def create_default_registry() -> AnalyzerRegistry:
-    """Create registry with all built-in analyzers."""
+def _analyze_in_worker(file: tuple[str, int]) -> tuple[str, AnalysisResult | None, str | None]:
+    """Analyze one ``(path, size)`` file inside a pool worker."""
+    path, size = file
+    return _analyze_path(_worker_registry, path, size)
+
+
+def _read_bytes(path: str, size: int) -> bytes:
+    """Read up to *size* bytes of a file with a single ``read`` call."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, size)
+    finally:
+        os.close(fd)
+
+
+def _resolve_read(
+    path: str,
+    analyzers: Sequence[Analyzer],
+    size: int,
+    pending: Future,
+) -> tuple[str, Sequence[Analyzer], int, bytes | None, str | None]:
+    """Wait for a read-ahead and report its content or error."""
+    try:
+        return path, analyzers, size, pending.result(), None
+    except OSError as e:
+        return path, analyzers, size, None, str(e)
+
+
+def _analyze_path(
+    registry: AnalyzerRegistry,
+    path: str,
+    size: int,
+) -> tuple[str, AnalysisResult | None, str | None]:
+    """Read and analyze one file, returning ``(path, result, error)``."""
+    try:
+        content = _read_bytes(path, size)
+        file_result = registry.analyze_file(Path(path), content, size=size)
+        return path, file_result, None
+    except Exception as e:
+        return path, None, str(e)
+
+
+def create_default_registry(result_cache_bytes: int = RESULT_CACHE_BYTES) -> AnalyzerRegistry:
+    """Create registry with all built-in analyzers.
+    
+    A positive *result_cache_bytes* enables memoizing analyzer output by
+    file content within that budget.
+    """
     from ..extractors.java import JavaAnalyzer
     from ..extractors.python import PythonAnalyzer
     from ..extractors.go import GoAnalyzer
@@ -113,7 +425,7 @@ def create_default_registry() -> AnalyzerRegistry:
     from ..extractors.schema import SchemaAnalyzer
     from ..extractors.config import ConfigAnalyzer
     
-    registry = AnalyzerRegistry()
+    registry = AnalyzerRegistry(result_cache_bytes=result_cache_bytes)
     
     registry.register(JavaAnalyzer())
     registry.register(PythonAnalyzer())
@@ -4,11 +4,13 @@ Manages running the full extraction pipeline (discover -> clone -> analyze ->
 output -> reload) in a background daemon thread so the webapp stays responsive.
 """
 
+import asyncio
 import threading
-import uuid
+import secrets
+import time
 from collections import deque
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
 from typing import Callable
@@ -27,6 +29,53 @@ class CrawlStage(str, Enum):
     FAILED = "failed"
 
 
+# Last (epoch second, "HH:MM:SS") pair produced by _utc_clock
+_clock_cache: tuple[int, str] = (-1, "")
+
+
+def _utc_clock() -> str:
+    """Return the current UTC time of day as ``HH:MM:SS``.
+
+    Log lines arrive in bursts, so the string is formatted at most once per
+    second and reused in between.
+    """
+    global _clock_cache
+    now = int(time.time())
+    second, text = _clock_cache
+    if now != second:
+        h, rem = divmod(now % 86400, 3600)
+        m, s = divmod(rem, 60)
+        text = f"{h:02d}:{m:02d}:{s:02d}"
+        _clock_cache = (now, text)
+    return text
+
+
+def _iso(timestamp: float | None) -> str | None:
+    """Format an epoch timestamp as a UTC ISO 8601 string."""
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat()
+
+
+# The ``src.main`` module, imported on first use by _load_pipeline
+_main_module = None
+
+
+def _load_pipeline():
+    """Return the ``src.main`` pipeline module, importing it only once.
+
+    The import is deferred to avoid circular imports (server.py imports this
+    module, and main.py imports shared deps) and so the API server does not
+    pull in the platform clients until a crawl actually runs. The first call
+    happens on the crawl thread, not the request thread.
+    """
+    global _main_module
+    if _main_module is None:
+        from .. import main
+        _main_module = main
+    return _main_module
+
+
 STAGE_ORDER = [
     CrawlStage.DISCOVER,
     CrawlStage.CLONE,
@@ -38,7 +87,11 @@ STAGE_ORDER = [
 
 @dataclass
 class CrawlJob:
-    """Represents a single crawl pipeline run."""
+    """Represents a single crawl pipeline run.
+
+    ``to_dict`` is called on every status poll, so the dict it builds is
+    cached and reused until a public field changes or a log line is added.
+    """
 
     job_id: str
     status: str = "idle"  # idle | running | completed | failed
@@ -46,27 +99,63 @@ class CrawlJob:
     stage_index: int = -1  # -1 = not started
     total_stages: int = len(STAGE_ORDER)  # 5
     stage_detail: str = ""
-    started_at: str | None = None
-    completed_at: str | None = None
+    started_at: float | None = None  # epoch seconds; ISO-formatted by to_dict
+    completed_at: float | None = None
     error: str | None = None
     use_llm: bool = False
     log: deque = field(default_factory=lambda: deque(maxlen=200))
+    _version: int = field(default=0, init=False, repr=False, compare=False)
+    _cached: tuple[int, dict] | None = field(default=None, init=False, repr=False, compare=False)
+    _log_version: int = field(default=0, init=False, repr=False, compare=False)
+    _log_snapshot: tuple[int, list[str]] = field(default=(0, []), init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value) -> None:
+        object.__setattr__(self, name, value)
+        if not name.startswith("_"):
+            object.__setattr__(self, "_version", self._version + 1)
+
+    def append_log(self, line: str) -> None:
+        """Append a line to the job log."""
+        self.log.append(line)
+        self._log_version += 1
+        self._version += 1
 
     def to_dict(self) -> dict:
-        """Convert the job state to a plain dictionary."""
-        return {
+        """Convert the job state to a plain dictionary.
+
+        The returned dict is shared between callers and must not be mutated.
+        """
+        # Read the version first: a concurrent change made while building
+        # leaves the cache tagged with the old version, forcing a rebuild.
+        version = self._version
+        cached = self._cached
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        data = {
             "job_id": self.job_id,
             "status": self.status,
             "current_stage": self.current_stage,
             "stage_index": self.stage_index,
             "total_stages": self.total_stages,
             "stage_detail": self.stage_detail,
-            "started_at": self.started_at,
-            "completed_at": self.completed_at,
+            "started_at": _iso(self.started_at),
+            "completed_at": _iso(self.completed_at),
             "error": self.error,
             "use_llm": self.use_llm,
-            "log": list(self.log),
+            "log": self._log_list(),
         }
+        self._cached = (version, data)
+        return data
+
+    def _log_list(self) -> list[str]:
+        """Return a list copy of the log, rebuilt only after new lines."""
+        log_version = self._log_version
+        snapshot_version, snapshot = self._log_snapshot
+        if snapshot_version != log_version:
+            snapshot = list(self.log)
+            self._log_snapshot = (log_version, snapshot)
+        return snapshot
 
 
 class CrawlManager:
@@ -86,6 +175,14 @@ class CrawlManager:
         self._on_complete_callback: Callable | None = None
         self._lock = threading.Lock()
         self._thread: threading.Thread | None = None
+        # Set by the pipeline thread when it exits, however it exits
+        self._done = threading.Event()
+        self._done.set()
+        # Bumped on every job change; waiters are (loop, event) pairs woken
+        # from whichever thread made the change
+        self.changes = 0
+        self._waiters_lock = threading.Lock()
+        self._waiters: set[tuple[asyncio.AbstractEventLoop, asyncio.Event]] = set()
 
     def set_on_complete(self, callback: Callable) -> None:
         """Register a callback invoked after a successful crawl.
@@ -97,16 +194,16 @@ class CrawlManager:
     def is_running(self) -> bool:
         """Return True if a pipeline is currently executing.
 
-        Also recovers from stale "running" state if the thread has died.
+        Also recovers from stale "running" state if the thread exited
+        without recording a final status.
         """
         if self.job.status == "running":
-            # Check if thread is actually alive; recover if it crashed
-            if self._thread is None or not self._thread.is_alive():
+            if self._done.is_set():
                 self.job.status = "failed"
                 self.job.current_stage = CrawlStage.FAILED.value
                 self.job.error = self.job.error or "Pipeline thread died unexpectedly"
-                self.job.completed_at = datetime.utcnow().isoformat()
-                self._log("Recovered from stale running state (thread dead)")
+                self.job.completed_at = time.time()
+                self._log("Recovered from stale running state (thread exited)")
                 return False
             return True
         return False
@@ -115,6 +212,26 @@ class CrawlManager:
         """Return the current job state as a plain dict."""
         return self.job.to_dict()
 
+    async def wait_for_change(self, seen: int, timeout: float) -> int:
+        """Wait until the job changes after *seen* or *timeout* seconds pass.
+
+        Returns the current change count, which equals *seen* on timeout.
+        """
+        if self.changes != seen:
+            return self.changes
+        waiter = (asyncio.get_running_loop(), asyncio.Event())
+        with self._waiters_lock:
+            self._waiters.add(waiter)
+        try:
+            if self.changes == seen:
+                await asyncio.wait_for(waiter[1].wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            with self._waiters_lock:
+                self._waiters.discard(waiter)
+        return self.changes
+
     def start(self, use_llm: bool = False) -> dict:
         """Kick off a new crawl pipeline in a background thread.
 
@@ -128,20 +245,24 @@ class CrawlManager:
                     "job": self.job.to_dict(),
                 }
 
-            job_id = uuid.uuid4().hex[:12]
+            job_id = secrets.token_hex(6)
+            done = threading.Event()
+            self._done = done
             self.job = CrawlJob(
                 job_id=job_id,
                 status="running",
-                started_at=datetime.utcnow().isoformat(),
+                started_at=time.time(),
                 use_llm=use_llm,
             )
 
         self._thread = threading.Thread(
             target=self._run_pipeline,
+            args=(done,),
             name=f"crawl-{job_id}",
             daemon=True,
         )
         self._thread.start()
+        self._notify()
 
         return self.job.to_dict()
 
@@ -150,9 +271,24 @@ class CrawlManager:
     # ------------------------------------------------------------------
 
     def _log(self, message: str) -> None:
-        """Append a timestamped message to the job log."""
-        timestamp = datetime.utcnow().strftime("%H:%M:%S")
-        self.job.log.append(f"[{timestamp}] {message}")
+        """Append a timestamped message to the job log.
+
+        Every job state change ends with a log line, so this is also where
+        stream waiters are woken.
+        """
+        self.job.append_log(f"[{_utc_clock()}] {message}")
+        self._notify()
+
+    def _notify(self) -> None:
+        """Record a job change and wake every ``wait_for_change`` caller."""
+        with self._waiters_lock:
+            self.changes += 1
+            waiters = list(self._waiters)
+        for loop, event in waiters:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                pass  # the waiter's loop has closed
 
     def _set_stage(self, stage: CrawlStage, detail: str = "") -> None:
         """Advance the job to *stage* and update related fields."""
@@ -162,24 +298,33 @@ class CrawlManager:
         self.job.stage_detail = detail
         self._log(f"Stage: {stage.value}" + (f" - {detail}" if detail else ""))
 
-    def _run_pipeline(self) -> None:
-        """Execute the full crawl pipeline (runs in a daemon thread)."""
+    def _run_pipeline(self, done: threading.Event) -> None:
+        """Execute the full crawl pipeline (runs in a daemon thread).
+
+        *done* is set on exit, including exits that bypass the error handler
+        (e.g. ``SystemExit`` from ``load_config``).
+        """
+        try:
+            self._execute_pipeline()
+        finally:
+            done.set()
+
+    def _execute_pipeline(self) -> None:
+        """Run each pipeline stage, recording the outcome on the job."""
         try:
-            # Import pipeline functions here to avoid circular imports
-            # (server.py imports this module, and main.py imports shared deps).
-            from ..main import load_config, run_crawl, run_clone, run_analyze, run_generate, discover_local_repos, _get_platform
+            pipeline = _load_pipeline()
 
             # ---- Load config ----
             self._log(f"Loading config from {self.config_path}")
-            config = load_config(Path(self.config_path))
-            platform = _get_platform(config)
+            config = pipeline.load_config(Path(self.config_path))
+            platform = pipeline._get_platform(config)
 
             repo_paths = []
 
             if platform == "local":
                 # ---- Local-only: scan directories ----
                 self._set_stage(CrawlStage.DISCOVER, "Scanning local directories")
-                repo_paths = discover_local_repos(config)
+                repo_paths = pipeline.discover_local_repos(config)
                 self._log(f"Found {len(repo_paths)} local repositories")
 
                 # Skip clone stage for local repos
@@ -188,19 +333,19 @@ class CrawlManager:
             else:
                 # ---- DISCOVER ----
                 self._set_stage(CrawlStage.DISCOVER, "Discovering repositories")
-                repos = run_crawl(config)
+                repos = pipeline.run_crawl(config)
                 self._log(f"Discovered {len(repos)} repositories")
 
                 # Also scan local directories if configured alongside the API platform
                 if "local" in config:
-                    local_paths = discover_local_repos(config)
+                    local_paths = pipeline.discover_local_repos(config)
                     self._log(f"Also found {len(local_paths)} local repositories")
                 else:
                     local_paths = []
 
                 # ---- CLONE ----
                 self._set_stage(CrawlStage.CLONE, "Cloning repositories")
-                repo_paths = run_clone(config, repos)
+                repo_paths = pipeline.run_clone(config, repos)
                 self._log(f"Cloned {len(repo_paths)} repositories successfully")
 
                 # Merge local paths into the set
@@ -209,7 +354,7 @@ class CrawlManager:
             # ---- ANALYZE ----
             mode = "LLM" if self.job.use_llm else "pattern"
             self._set_stage(CrawlStage.ANALYZE, f"Analyzing with {mode} extraction")
-            kb = run_analyze(config, repo_paths, use_llm=self.job.use_llm)
+            kb = pipeline.run_analyze(config, repo_paths, use_llm=self.job.use_llm)
             summary = kb.get_summary()
             self._log(
                 f"Analysis complete: "
@@ -222,7 +367,7 @@ class CrawlManager:
 
             # ---- OUTPUT ----
             self._set_stage(CrawlStage.OUTPUT, "Generating output files")
-            run_generate(config, kb)
+            pipeline.run_generate(config, kb)
             self._log("Output generation complete")
 
             # ---- RELOADING ----
@@ -236,12 +381,12 @@ class CrawlManager:
             # ---- COMPLETED ----
             self.job.status = "completed"
             self.job.current_stage = CrawlStage.COMPLETED.value
-            self.job.completed_at = datetime.utcnow().isoformat()
+            self.job.completed_at = time.time()
             self._log("Crawl pipeline finished successfully")
 
         except Exception as exc:
             self.job.status = "failed"
             self.job.current_stage = CrawlStage.FAILED.value
             self.job.error = str(exc)
-            self.job.completed_at = datetime.utcnow().isoformat()
+            self.job.completed_at = time.time()
             self._log(f"Pipeline failed: {exc}")
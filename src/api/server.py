@@ -1,19 +1,34 @@
 """FastAPI REST API server for SenseBase."""
 
-import asyncio
-import json
+import copy
+import gc
+import hashlib
+import importlib.util
 import logging
 import os
+import secrets
+from bisect import bisect_right
 from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from itertools import islice
 from pathlib import Path
-from typing import Annotated, Any
+from typing import Annotated, Any, Callable, Iterable
 
-from fastapi import FastAPI, HTTPException, Query
+import anyio.to_thread
+import orjson
+import yaml
+from fastapi import BackgroundTasks, Depends, FastAPI, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import FileResponse, JSONResponse, RedirectResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel, Field
+from starlette.types import ASGIApp, Receive, Scope, Send
 
+from ..query.index import KBIndex
 from ..query.search import SearchEngine
 from ..store.knowledge_base import KnowledgeBase
 from .crawl_manager import CrawlManager
@@ -21,6 +36,33 @@ from .crawl_manager import CrawlManager
 logger = logging.getLogger(__name__)
 
 
+class OrjsonResponse(JSONResponse):
+    """JSON response serialized with orjson."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+class _GZipExceptPaths:
+    """GZipMiddleware that passes requests for *exclude_paths* through as-is.
+
+    Not every supported Starlette release skips text/event-stream in its
+    gzip middleware; those that don't buffer SSE frames until the stream
+    ends, so streaming routes are excluded by path.
+    """
+
+    def __init__(self, app: ASGIApp, exclude_paths: Iterable[str] = (), **options: Any):
+        self.app = app
+        self.gzip = GZipMiddleware(app, **options)
+        self.exclude_paths = frozenset(exclude_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+        else:
+            await self.gzip(scope, receive, send)
+
+
 # Request/Response Models
 class SearchRequest(BaseModel):
     """Search request body."""
@@ -140,10 +182,334 @@ class StatsResponse(BaseModel):
     dependencies: int = 0
 
 
+def _projector(model: type[BaseModel]):
+    """Return a function copying a KB row into *model*'s response shape.
+
+    Knowledge-base rows are produced by our own pipeline, so list endpoints
+    project them onto the documented fields instead of validating each row.
+    """
+    defaults = [
+        (name, field.get_default(call_default_factory=True))
+        for name, field in model.model_fields.items()
+    ]
+    return lambda row: {name: row.get(name, default) for name, default in defaults}
+
+
+_schema_view = _projector(SchemaDetail)
+_service_view = _projector(ServiceDetail)
+_api_view = _projector(APIEndpoint)
+
+# List endpoints only change when the knowledge base is reloaded, so clients
+# may keep responses but must revalidate them against the ETag each time.
+KB_CACHE_CONTROL = "public, no-cache"
+
+# Finished semantic indexing jobs kept for status queries
+INDEX_JOB_HISTORY = 20
+
+# Threads for blocking search calls. Concurrent semantic searches wait in
+# these threads for a shared model call or collection query, so more
+# threads mean larger batches rather than more CPU contention.
+THREADPOOL_SIZE = 64
+
+# libyaml-backed safe loader/dumper for the config file, when PyYAML has them
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Environment variables that supply an LLM API key when the config has none
+LLM_KEY_ENV_VARS = ("ANTHROPIC_API_KEY", "OPENAI_API_KEY", "AWS_ACCESS_KEY_ID")
+
+# Seconds between keepalive comments on an idle /crawl/stream connection
+SSE_HEARTBEAT_INTERVAL = 15.0
+
+
+def _freeze_heap() -> None:
+    """Move everything live into the garbage collector's permanent generation.
+
+    The knowledge base and search models are large and live until the next
+    reload: frozen, full collections stop traversing them and never write
+    to their pages (keeping them shared with any forked workers). Earlier
+    frozen objects are unfrozen and collected first so replaced indexes
+    are not frozen as garbage.
+    """
+    gc.unfreeze()
+    gc.collect()
+    gc.freeze()
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Whether an If-None-Match header value matches *etag* (weakly)."""
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def _service_matcher(service_names: Iterable[str]) -> Callable[[str], str | None]:
+    """Return a function matching an API handler to a service, case-insensitively.
+
+    A handler matches a service whose name it contains (the longest such
+    name wins) or, failing that, one whose name contains it. Instead of
+    testing every name against every handler, the handler's substrings of
+    each name length are looked up in a dict, and the handler is searched
+    for in one string joining all the names.
+    """
+    by_lower: dict[str, str] = {}
+    for name in service_names:
+        if name:
+            by_lower.setdefault(name.lower(), name)
+    lengths = sorted({len(lower) for lower in by_lower}, reverse=True)
+    lowers = list(by_lower)
+    starts = []
+    offset = 0
+    for lower in lowers:
+        starts.append(offset)
+        offset += len(lower) + 1
+    joined = "\0".join(lowers)
+
+    def match(handler: str) -> str | None:
+        handler = handler.lower()
+        for length in lengths:
+            for i in range(len(handler) - length + 1):
+                name = by_lower.get(handler[i:i + length])
+                if name is not None:
+                    return name
+        if "\0" not in handler:
+            pos = joined.find(handler)
+            if pos != -1:
+                return by_lower[lowers[bisect_right(starts, pos) - 1]]
+        return None
+
+    return match
+
+
+def _build_graph(kb_data: dict) -> dict[str, Any]:
+    """Build the knowledge graph's nodes, edges and stats from a loaded KB."""
+    nodes: list[dict[str, Any]] = []
+    edges: list[dict[str, Any]] = []
+    node_ids: set[str] = set()
+
+    # Helper to add a node only once
+    def add_node(
+        node_id: str,
+        label: str,
+        node_type: str,
+        repo: str | None = None,
+        metadata: dict[str, Any] | None = None,
+    ) -> None:
+        if node_id not in node_ids:
+            node_ids.add(node_id)
+            node: dict[str, Any] = {
+                "id": node_id,
+                "label": label,
+                "type": node_type,
+            }
+            if repo is not None:
+                node["repo"] = repo
+            node["metadata"] = metadata or {}
+            nodes.append(node)
+
+    # Each collection is walked once: nodes are added as it goes, and the
+    # outgoing references are kept to become edges once every node exists.
+    schema_relationships: list[tuple[str, list]] = []
+    service_dependencies: list[tuple[str, list]] = []
+    service_data_access: list[tuple[str, list]] = []
+    service_names: list[str] = []
+
+    # --- Schema nodes ---
+    for schema in kb_data.get("schemas", []):
+        schema_relationships.append((f"schema:{schema.get('name', '')}", schema.get("relationships", [])))
+        name = schema.get("name", "unknown")
+        repo = schema.get("repo", "")
+        node_id = f"schema:{name}"
+        add_node(
+            node_id,
+            label=name,
+            node_type="schema",
+            repo=repo,
+            metadata={
+                "type": schema.get("type", ""),
+                "source_file": schema.get("source_file", ""),
+                "fields": schema.get("fields", []),
+            },
+        )
+
+    # --- Service nodes ---
+    for service in kb_data.get("services", []):
+        src_name = service.get("name", "")
+        service_names.append(src_name)
+        service_dependencies.append((f"service:{src_name}", service.get("dependencies", [])))
+        service_data_access.append((f"service:{src_name}", service.get("data_accessed", [])))
+        name = service.get("name", "unknown")
+        repo = service.get("repo", "")
+        node_id = f"service:{name}"
+        add_node(
+            node_id,
+            label=name,
+            node_type="service",
+            repo=repo,
+            metadata={
+                "type": service.get("type", ""),
+                "source_file": service.get("source_file", ""),
+                "description": service.get("description", ""),
+                "methods": service.get("methods", []),
+            },
+        )
+
+    # --- API nodes ---
+    for api in kb_data.get("apis", []):
+        method = api.get("method", "")
+        path = api.get("path", "")
+        repo = api.get("repo", "")
+        label = f"{method} {path}" if method else path
+        node_id = f"api:{label}"
+        add_node(
+            node_id,
+            label=label,
+            node_type="api",
+            repo=repo,
+            metadata={
+                "handler": api.get("handler", ""),
+                "source_file": api.get("source_file", ""),
+                "description": api.get("description", ""),
+                "params": api.get("params", []),
+            },
+        )
+
+    # --- Dependency nodes (top 50 most used) ---
+    dep_counter: Counter[str] = Counter()
+    dep_records: dict[str, dict[str, Any]] = {}
+    for dep in kb_data.get("dependencies", []):
+        name = dep.get("name", "")
+        if name:
+            dep_counter[name] += 1
+            if name not in dep_records:
+                dep_records[name] = dep
+
+    top_deps = dep_counter.most_common(50)
+    for dep_name, count in top_deps:
+        dep = dep_records[dep_name]
+        node_id = f"dep:{dep_name}"
+        add_node(
+            node_id,
+            label=dep_name,
+            node_type="dependency",
+            metadata={
+                "ecosystem": dep.get("ecosystem", ""),
+                "version": dep.get("version", ""),
+                "usage_count": count,
+            },
+        )
+
+    # --- Build service name lookup for matching ---
+    match_service = _service_matcher(service_names)
+
+    # --- Edges: service -> dependency service (depends_on) ---
+    for src_id, dependencies in service_dependencies:
+        for dep_name in dependencies:
+            # Check if the dependency matches a known service
+            target_id = f"service:{dep_name}"
+            if f"service:{dep_name}" in node_ids:
+                edges.append({
+                    "source": src_id,
+                    "target": target_id,
+                    "type": "depends_on",
+                    "label": "depends on",
+                })
+
+    # --- Edges: service -> schema (data_access) ---
+    for src_id, data_accessed in service_data_access:
+        for accessed in data_accessed:
+            accessed_name = accessed if isinstance(accessed, str) else accessed.get("name", "")
+            target_id = f"schema:{accessed_name}"
+            if target_id in node_ids:
+                edges.append({
+                    "source": src_id,
+                    "target": target_id,
+                    "type": "data_access",
+                    "label": "reads",
+                })
+
+    # --- Edges: schema -> schema (relationship) ---
+    for src_id, relationships in schema_relationships:
+        for rel in relationships:
+            target_name = rel.get("target", "") if isinstance(rel, dict) else str(rel)
+            target_id = f"schema:{target_name}"
+            rel_label = rel.get("type", "related") if isinstance(rel, dict) else "related"
+            if target_id in node_ids:
+                edges.append({
+                    "source": src_id,
+                    "target": target_id,
+                    "type": "relationship",
+                    "label": rel_label,
+                })
+
+    # --- Edges: API -> service (handler) ---
+    for api in kb_data.get("apis", []):
+        handler = api.get("handler", "")
+        if not handler:
+            continue
+        method = api.get("method", "")
+        path = api.get("path", "")
+        label = f"{method} {path}" if method else path
+        src_id = f"api:{label}"
+
+        # Try to match handler to a service name
+        matched_service = match_service(handler)
+
+        if matched_service:
+            edges.append({
+                "source": src_id,
+                "target": f"service:{matched_service}",
+                "type": "handler",
+                "label": "handled by",
+            })
+
+    # --- Edges: data flows ---
+    for flow in kb_data.get("data_flows", []):
+        source_name = flow.get("source", "")
+        target_name = flow.get("target", "")
+        if source_name and target_name:
+            # Try to resolve to existing node ids
+            source_id = (
+                f"service:{source_name}"
+                if f"service:{source_name}" in node_ids
+                else source_name
+            )
+            target_id = (
+                f"service:{target_name}"
+                if f"service:{target_name}" in node_ids
+                else target_name
+            )
+            edges.append({
+                "source": source_id,
+                "target": target_id,
+                "type": "data_flow",
+                "label": flow.get("description", "data flow"),
+            })
+
+    # --- Stats ---
+    node_type_counts = dict(Counter(node["type"] for node in nodes))
+
+    return {
+        "nodes": nodes,
+        "edges": edges,
+        "stats": {
+            "total_nodes": len(nodes),
+            "total_edges": len(edges),
+            "node_types": node_type_counts,
+        },
+    }
+
+
 # Global state (initialized on startup)
 _search_engine: SearchEngine | None = None
 _semantic_search = None
+_query_cache = None
 _kb_data: dict | None = None
+_kb_index: KBIndex | None = None
+_kb_etag: str | None = None
+_graph_cache: tuple[dict, bytes] | None = None  # (KB it was built from, JSON body)
 
 
 def create_app(
@@ -151,15 +517,32 @@ def create_app(
     chroma_path: str = "./output/vectors/chroma",
     enable_semantic: bool = True,
     config_path: str = "config/config.yaml",
+    semantic_cache_threshold: float = 0.95,
 ) -> FastAPI:
     """Create and configure the FastAPI application."""
     
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        """Load the knowledge base and warm up semantic search before serving."""
+        anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+        
+        # Load keyword search
+        await run_in_threadpool(_load_keyword_search)
+        
+        # Load semantic search if enabled
+        if enable_semantic:
+            await run_in_threadpool(_load_semantic_search)
+        yield
+        semantic_reloads.shutdown(wait=False, cancel_futures=True)
+    
     app = FastAPI(
         title="SenseBase API",
         description="Knowledge extraction and search API for GitLab repositories",
         version="0.1.0",
         docs_url="/docs",
         redoc_url="/redoc",
+        default_response_class=OrjsonResponse,
+        lifespan=lifespan,
     )
     
     # CORS middleware
@@ -171,32 +554,79 @@ def create_app(
         allow_headers=["*"],
     )
     
-    @app.on_event("startup")
-    async def startup():
-        """Initialize search engines on startup."""
-        global _search_engine, _semantic_search, _kb_data
-        
-        # Load keyword search
-        _search_engine = SearchEngine(kb_path)
-        _kb_data = _search_engine.data
-        
-        # Load semantic search if enabled
-        if enable_semantic:
-            try:
-                from ..query.embeddings import SemanticSearch
-                _semantic_search = SemanticSearch(persist_dir=chroma_path)
-                count = _semantic_search.collection.count()
-
-                # Auto-index if ChromaDB is empty but chunks.json exists
-                if count == 0:
-                    chunks_path = Path(chroma_path).parent / "chunks.json"
-                    if chunks_path.exists():
-                        logger.info("ChromaDB empty, auto-indexing from %s...", chunks_path)
-                        indexed = _semantic_search.index_chunks(chunks_path)
-                        logger.info("Indexed %d chunks into ChromaDB", indexed)
-            except Exception as e:
-                logger.warning("Semantic search unavailable: %s", e)
-                _semantic_search = None
+    # Compress JSON bodies; small responses and the SSE crawl stream are
+    # passed through unbuffered.
+    app.add_middleware(
+        _GZipExceptPaths,
+        exclude_paths=("/crawl/stream",),
+        minimum_size=1024,
+        compresslevel=6,
+    )
+    
+    def _load_keyword_search():
+        """Load the knowledge base and build its filter indexes."""
+        global _search_engine, _kb_data, _kb_index, _kb_etag, _graph_cache
+        search_engine = SearchEngine(kb_path)
+        kb_data = search_engine.data
+        kb_index = KBIndex(kb_data)
+        digest = hashlib.blake2b(orjson.dumps(kb_data), digest_size=16).hexdigest()
+        # Swap in together, so no response pairs the new data with the old ETag
+        _search_engine, _kb_data, _kb_index, _kb_etag, _graph_cache = (
+            search_engine, kb_data, kb_index, f'"{digest}"', None
+        )
+        _freeze_heap()
+    
+    def _cache_headers() -> dict[str, str]:
+        return {"ETag": _kb_etag, "Cache-Control": KB_CACHE_CONTROL} if _kb_etag else {}
+    
+    def _etag_guard(request: Request):
+        """Answer 304 when the client already holds the current KB's response."""
+        if_none_match = request.headers.get("if-none-match")
+        if _kb_data and _kb_etag and if_none_match and _etag_matches(if_none_match, _kb_etag):
+            raise HTTPException(status_code=304, headers=_cache_headers())
+    
+    def _load_semantic_search():
+        """Open the vector store and load the embedding model up front.
+
+        One query is embedded and run against the collection so the model
+        weights, inference kernels and vector index are loaded before the
+        first user request instead of during it.
+        """
+        global _semantic_search, _query_cache
+        try:
+            from ..query.embeddings import SemanticSearch
+            from ..query.semantic_cache import SemanticQueryCache
+            semantic_search = SemanticSearch(persist_dir=chroma_path)
+            query_cache = SemanticQueryCache(threshold=semantic_cache_threshold)
+            count = semantic_search.collection.count()
+
+            # Auto-index if ChromaDB is empty but chunks.json exists
+            if count == 0:
+                chunks_path = Path(chroma_path).parent / "chunks.json"
+                if chunks_path.exists():
+                    logger.info("ChromaDB empty, auto-indexing from %s...", chunks_path)
+                    count = semantic_search.index_chunks(chunks_path)
+                    logger.info("Indexed %d chunks into ChromaDB", count)
+        except Exception as e:
+            logger.warning("Semantic search unavailable: %s", e)
+            _semantic_search = None
+            return
+
+        try:
+            embedding = semantic_search.embed("warmup")
+            if count:
+                semantic_search.collection.query(
+                    query_embeddings=[list(map(float, embedding))],
+                    n_results=1,
+                )
+        except Exception as e:
+            logger.warning("Semantic search warmup failed: %s", e)
+
+        # Swap in only once ready, so a reload never serves a half-loaded index
+        _semantic_search, _query_cache = semantic_search, query_cache
+        # The replaced instance was frozen along with everything else live
+        # at the last keyword reload; release it and freeze the new one
+        _freeze_heap()
     
     # Health check
     @app.get("/health")
@@ -209,11 +639,12 @@ def create_app(
         }
     
     # Statistics
-    @app.get("/stats", response_model=StatsResponse)
-    async def get_stats():
+    @app.get("/stats", response_model=StatsResponse, dependencies=[Depends(_etag_guard)])
+    async def get_stats(response: Response):
         """Get knowledge base statistics."""
         if not _kb_data:
             raise HTTPException(status_code=503, detail="Knowledge base not loaded")
+        response.headers.update(_cache_headers())
 
         summary = _kb_data.get("summary", {})
         return StatsResponse(
@@ -226,30 +657,31 @@ def create_app(
         )
     
     # Keyword Search
-    @app.post("/search", response_model=SearchResponse)
-    async def search(request: SearchRequest):
-        """
-        Keyword search across the knowledge base.
-        Searches schemas, APIs, services, and dependencies.
-        """
+    # The GET endpoints validate their query parameters with the same bounds
+    # as the request models and share these helpers with the POST endpoints.
+    async def _keyword_search(
+        query: str, limit: int, type_filter: str | None, repo_filter: str | None,
+    ) -> SearchResponse:
         if not _search_engine:
             raise HTTPException(status_code=503, detail="Search engine not loaded")
         
-        results = _search_engine.search(request.query, limit=request.limit)
+        results = await run_in_threadpool(_search_engine.search, query, limit=limit)
         
         # Apply filters
-        if request.type_filter:
-            results = [r for r in results if r.get("type") == request.type_filter]
-        if request.repo_filter:
+        if type_filter:
+            results = [r for r in results if r.get("type") == type_filter]
+        if repo_filter:
             results = [
                 r for r in results 
-                if request.repo_filter.lower() in r.get("data", {}).get("repo", "").lower()
+                if repo_filter.lower() in r.get("data", {}).get("repo", "").lower()
             ]
         
+        # Results come from our own knowledge base: build the response
+        # models without re-validating every field.
         formatted = []
         for r in results:
             data = r.get("data", {})
-            formatted.append(SearchResult(
+            formatted.append(SearchResult.model_construct(
                 type=r.get("type", "unknown"),
                 name=r.get("name", "unknown"),
                 score=r.get("score", 0),
@@ -258,118 +690,141 @@ def create_app(
                 data=data,
             ))
         
-        return SearchResponse(
-            query=request.query,
+        return SearchResponse.model_construct(
+            query=query,
             count=len(formatted),
             results=formatted,
         )
     
+    @app.post("/search", response_model=SearchResponse)
+    async def search(request: SearchRequest):
+        """
+        Keyword search across the knowledge base.
+        Searches schemas, APIs, services, and dependencies.
+        """
+        return await _keyword_search(request.query, request.limit, request.type_filter, request.repo_filter)
+    
     @app.get("/search")
     async def search_get(
         q: Annotated[str, Query(description="Search query")],
-        limit: int = 20,
+        limit: Annotated[int, Query(ge=1, le=100)] = 20,
         type: str | None = None,
         repo: str | None = None,
     ):
         """Keyword search (GET method for convenience)."""
-        return await search(SearchRequest(
-            query=q,
-            limit=limit,
-            type_filter=type,
-            repo_filter=repo,
-        ))
+        return await _keyword_search(q, limit, type, repo)
     
-    # Semantic Search
-    @app.post("/semantic/search", response_model=SemanticSearchResponse)
-    async def semantic_search(request: SemanticSearchRequest):
-        """
-        Semantic search using embeddings.
-        Finds conceptually similar content using natural language.
-        """
+    async def _semantic_search_response(
+        query: str, limit: int, type_filter: str | None, repo_filter: str | None,
+    ) -> SemanticSearchResponse:
         if not _semantic_search:
             raise HTTPException(
                 status_code=503, 
                 detail="Semantic search not available. Run indexing first."
             )
         
-        results = _semantic_search.search(
-            request.query,
-            limit=request.limit,
-            type_filter=request.type_filter,
-            repo_filter=request.repo_filter,
-        )
+        # Near-duplicate queries with the same filters reuse cached results
+        query_embedding = await run_in_threadpool(_semantic_search.embed, query)
+        scope = ("search", type_filter, repo_filter, limit)
+        results = _query_cache.get(scope, query_embedding)
+        if results is None:
+            results = await run_in_threadpool(
+                _semantic_search.search,
+                query,
+                limit=limit,
+                type_filter=type_filter,
+                repo_filter=repo_filter,
+                query_embedding=query_embedding,
+            )
+            _query_cache.put(scope, query_embedding, results)
         
-        formatted = [SemanticResult(**r) for r in results]
+        formatted = [SemanticResult.model_construct(**r) for r in results]
         
-        return SemanticSearchResponse(
-            query=request.query,
+        return SemanticSearchResponse.model_construct(
+            query=query,
             count=len(formatted),
             results=formatted,
         )
     
+    # Semantic Search
+    @app.post("/semantic/search", response_model=SemanticSearchResponse)
+    async def semantic_search(request: SemanticSearchRequest):
+        """
+        Semantic search using embeddings.
+        Finds conceptually similar content using natural language.
+        """
+        return await _semantic_search_response(
+            request.query, request.limit, request.type_filter, request.repo_filter,
+        )
+    
     @app.get("/semantic/search")
     async def semantic_search_get(
         q: Annotated[str, Query(description="Natural language query")],
-        limit: int = 10,
+        limit: Annotated[int, Query(ge=1, le=50)] = 10,
         type: str | None = None,
         repo: str | None = None,
     ):
         """Semantic search (GET method)."""
-        return await semantic_search(SemanticSearchRequest(
-            query=q,
-            limit=limit,
-            type_filter=type,
-            repo_filter=repo,
-        ))
+        return await _semantic_search_response(q, limit, type, repo)
     
-    # Question Answering (RAG context)
-    @app.post("/ask", response_model=AskResponse)
-    async def ask_question(request: AskRequest):
-        """
-        Question-answering endpoint.
-        Returns relevant context for RAG pipelines.
-        Prepends matching query recipes from the semantic business layer.
-        """
+    async def _answer(question: str, limit: int) -> AskResponse:
         if not _semantic_search:
             raise HTTPException(
                 status_code=503,
                 detail="Semantic search not available"
             )
 
-        result = _semantic_search.ask(request.question, limit=request.limit)
+        query_embedding = await run_in_threadpool(_semantic_search.embed, question)
+        scope = ("ask", limit)
+        cached = _query_cache.get(scope, query_embedding)
+        if cached is None:
+            cached = await run_in_threadpool(
+                _semantic_search.ask,
+                question,
+                limit=limit,
+                query_embedding=query_embedding,
+            )
+            _query_cache.put(scope, query_embedding, cached)
+        # Copy: the cached dict is shared, and may be for a rephrasing
+        result = {**cached, "question": question}
 
         # Search query recipes for matching questions
         if _kb_data:
-            q_lower = request.question.lower()
-            q_terms = q_lower.split()
-            matching_recipes = []
-            for sl in _kb_data.get("semantic_layers", []):
-                for recipe in sl.get("query_recipes", []):
-                    recipe_q = recipe.get("question", "").lower()
-                    if any(term in recipe_q for term in q_terms if len(term) > 3):
-                        matching_recipes.append(recipe)
+            matching_recipes = _kb_index.matching_recipes(question, limit=3)
 
             if matching_recipes:
-                recipe_context = "QUERY RECIPES (step-by-step instructions to answer similar questions):\n"
-                for r in matching_recipes[:3]:
-                    recipe_context += f"\nQ: {r.get('question', '')}\n"
+                parts = ["QUERY RECIPES (step-by-step instructions to answer similar questions):\n"]
+                for r in matching_recipes:
+                    parts.append(f"\nQ: {r.get('question', '')}\n")
                     for step in r.get("steps", []):
-                        recipe_context += f"  - {step.get('action', '')} ({step.get('purpose', '')})\n"
-                    recipe_context += f"  Answer format: {r.get('answer_format', '')}\n"
-                result["context"] = recipe_context + "\n---\n\n" + result.get("context", "")
+                        parts.append(f"  - {step.get('action', '')} ({step.get('purpose', '')})\n")
+                    parts.append(f"  Answer format: {r.get('answer_format', '')}\n")
+                parts.append("\n---\n\n")
+                parts.append(result.get("context", ""))
+                result["context"] = "".join(parts)
 
-        return AskResponse(**result)
+        return AskResponse.model_construct(**result)
+    
+    # Question Answering (RAG context)
+    @app.post("/ask", response_model=AskResponse)
+    async def ask_question(request: AskRequest):
+        """
+        Question-answering endpoint.
+        Returns relevant context for RAG pipelines.
+        Prepends matching query recipes from the semantic business layer.
+        """
+        return await _answer(request.question, request.limit)
     
     @app.get("/ask")
     async def ask_get(
         q: Annotated[str, Query(description="Question")],
-        limit: int = 5,
+        limit: Annotated[int, Query(ge=1, le=20)] = 5,
     ):
         """Ask a question (GET method)."""
-        return await ask_question(AskRequest(question=q, limit=limit))
+        return await _answer(q, limit)
     
     # Schema endpoints
-    @app.get("/schemas", response_model=list[SchemaDetail])
+    @app.get("/schemas", responses={200: {"model": list[SchemaDetail]}}, dependencies=[Depends(_etag_guard)])
     async def list_schemas(
         name: str | None = None,
         type: str | None = None,
@@ -380,16 +835,9 @@ def create_app(
         if not _kb_data:
             raise HTTPException(status_code=503, detail="Knowledge base not loaded")
         
-        schemas = _kb_data.get("schemas", [])
+        schemas = _kb_index.find_schemas(name=name, type=type, repo=repo)
         
-        if name:
-            schemas = [s for s in schemas if name.lower() in s.get("name", "").lower()]
-        if type:
-            schemas = [s for s in schemas if s.get("type") == type]
-        if repo:
-            schemas = [s for s in schemas if repo.lower() in s.get("repo", "").lower()]
-        
-        return [SchemaDetail(**s) for s in schemas[:limit]]
+        return OrjsonResponse([_schema_view(s) for s in islice(schemas, limit)], headers=_cache_headers())
     
     @app.get("/schemas/{name}", response_model=list[SchemaDetail])
     async def get_schema(name: str):
@@ -397,26 +845,26 @@ def create_app(
         if not _search_engine:
             raise HTTPException(status_code=503, detail="Search engine not loaded")
         
-        results = _search_engine.find_schema(name)
+        results = await run_in_threadpool(_search_engine.find_schema, name)
         if not results:
             raise HTTPException(status_code=404, detail=f"Schema '{name}' not found")
         
-        return [SchemaDetail(**s) for s in results]
+        return [SchemaDetail.model_construct(**s) for s in results]
     
     @app.get("/schemas/{name}/relationships")
     async def get_schema_relationships(name: str):
         """Get all relationships for a schema."""
-        if not _search_engine:
+        if not _kb_index:
             raise HTTPException(status_code=503, detail="Search engine not loaded")
         
-        relationships = _search_engine.get_schema_relationships(name)
+        relationships = _kb_index.schema_relationships(name)
         if not relationships["references_to"] and not relationships["referenced_by"]:
             raise HTTPException(status_code=404, detail=f"Schema '{name}' not found")
         
         return relationships
     
     # Service endpoints
-    @app.get("/services", response_model=list[ServiceDetail])
+    @app.get("/services", responses={200: {"model": list[ServiceDetail]}}, dependencies=[Depends(_etag_guard)])
     async def list_services(
         name: str | None = None,
         repo: str | None = None,
@@ -426,14 +874,9 @@ def create_app(
         if not _kb_data:
             raise HTTPException(status_code=503, detail="Knowledge base not loaded")
         
-        services = _kb_data.get("services", [])
-        
-        if name:
-            services = [s for s in services if name.lower() in s.get("name", "").lower()]
-        if repo:
-            services = [s for s in services if repo.lower() in s.get("repo", "").lower()]
+        services = _kb_index.find_services(name=name, repo=repo)
         
-        return [ServiceDetail(**s) for s in services[:limit]]
+        return OrjsonResponse([_service_view(s) for s in islice(services, limit)], headers=_cache_headers())
     
     @app.get("/services/{name}", response_model=list[ServiceDetail])
     async def get_service(name: str):
@@ -441,26 +884,26 @@ def create_app(
         if not _search_engine:
             raise HTTPException(status_code=503, detail="Search engine not loaded")
         
-        results = _search_engine.find_service(name)
+        results = await run_in_threadpool(_search_engine.find_service, name)
         if not results:
             raise HTTPException(status_code=404, detail=f"Service '{name}' not found")
         
-        return [ServiceDetail(**s) for s in results]
+        return [ServiceDetail.model_construct(**s) for s in results]
     
     @app.get("/services/{name}/dependencies")
     async def get_service_dependencies(name: str):
         """Get dependency graph for a service."""
-        if not _search_engine:
+        if not _kb_index:
             raise HTTPException(status_code=503, detail="Search engine not loaded")
         
-        graph = _search_engine.get_service_dependencies(name)
+        graph = _kb_index.service_dependencies(name)
         if not graph["depends_on"] and not graph["depended_by"]:
             raise HTTPException(status_code=404, detail=f"Service '{name}' not found")
         
         return graph
     
     # API endpoints
-    @app.get("/apis", response_model=list[APIEndpoint])
+    @app.get("/apis", responses={200: {"model": list[APIEndpoint]}}, dependencies=[Depends(_etag_guard)])
     async def list_apis(
         path: str | None = None,
         method: str | None = None,
@@ -471,19 +914,12 @@ def create_app(
         if not _kb_data:
             raise HTTPException(status_code=503, detail="Knowledge base not loaded")
         
-        apis = _kb_data.get("apis", [])
+        apis = _kb_index.find_apis(path=path, method=method, repo=repo)
         
-        if path:
-            apis = [a for a in apis if path.lower() in a.get("path", "").lower()]
-        if method:
-            apis = [a for a in apis if a.get("method", "").upper() == method.upper()]
-        if repo:
-            apis = [a for a in apis if repo.lower() in a.get("repo", "").lower()]
-        
-        return [APIEndpoint(**a) for a in apis[:limit]]
+        return OrjsonResponse([_api_view(a) for a in islice(apis, limit)], headers=_cache_headers())
     
     # Dependencies endpoints
-    @app.get("/dependencies")
+    @app.get("/dependencies", dependencies=[Depends(_etag_guard)])
     async def list_dependencies(
         name: str | None = None,
         ecosystem: str | None = None,
@@ -493,23 +929,10 @@ def create_app(
         if not _kb_data:
             raise HTTPException(status_code=503, detail="Knowledge base not loaded")
         
-        deps = _kb_data.get("dependencies", [])
+        # Deduplicated by name when the index is built
+        deps = _kb_index.find_unique_dependencies(name=name, ecosystem=ecosystem)
         
-        if name:
-            deps = [d for d in deps if name.lower() in d.get("name", "").lower()]
-        if ecosystem:
-            deps = [d for d in deps if d.get("ecosystem") == ecosystem]
-        
-        # Deduplicate by name
-        seen = set()
-        unique_deps = []
-        for d in deps:
-            key = d.get("name", "")
-            if key not in seen:
-                seen.add(key)
-                unique_deps.append(d)
-        
-        return unique_deps[:limit]
+        return OrjsonResponse(list(islice(deps, limit)), headers=_cache_headers())
     
     @app.get("/dependencies/{name}/usage")
     async def get_dependency_usage(name: str):
@@ -517,28 +940,78 @@ def create_app(
         if not _search_engine:
             raise HTTPException(status_code=503, detail="Search engine not loaded")
         
-        results = _search_engine.find_dependency_usage(name)
+        results = await run_in_threadpool(_search_engine.find_dependency_usage, name)
         if not results:
             raise HTTPException(status_code=404, detail=f"Dependency '{name}' not found")
         
-        return {
+        return OrjsonResponse({
             "name": name,
             "usage_count": len(results),
             "usages": results,
-        }
+        })
     
     # Semantic index management
-    @app.post("/semantic/index")
-    async def index_chunks(chunks_path: str = "./output/vectors/chunks.json"):
-        """Index chunks for semantic search."""
+    # Semantic indexing jobs by id, oldest first
+    _index_jobs: dict[str, dict[str, Any]] = {}
+    
+    def _run_index_job(job: dict[str, Any], semantic_search, chunks_path: str):
+        """Index *chunks_path* in the background, recording progress on *job*."""
+        def progress(embedded: int, total: int):
+            job["embedded"] = embedded
+            job["total"] = total
+        
+        job["status"] = "running"
+        try:
+            job["indexed"] = semantic_search.index_chunks(chunks_path, progress=progress)
+            job["status"] = "completed"
+        except Exception as e:
+            logger.exception("Semantic indexing failed")
+            job["error"] = str(e)
+            job["status"] = "failed"
+        finally:
+            job["completed_at"] = datetime.now(timezone.utc).isoformat()
+            if _query_cache is not None:
+                _query_cache.clear()
+    
+    @app.post("/semantic/index", status_code=202)
+    async def index_chunks(
+        background_tasks: BackgroundTasks,
+        chunks_path: str = "./output/vectors/chunks.json",
+    ):
+        """Start indexing chunks for semantic search; poll the returned job for progress."""
         if not _semantic_search:
             raise HTTPException(
                 status_code=503,
                 detail="Semantic search not configured"
             )
+        if any(job["status"] in ("queued", "running") for job in _index_jobs.values()):
+            raise HTTPException(status_code=409, detail="Semantic indexing is already running")
         
-        count = _semantic_search.index_chunks(chunks_path)
-        return {"indexed": count}
+        job = {
+            "job_id": secrets.token_hex(6),
+            "status": "queued",
+            "chunks_path": chunks_path,
+            "embedded": 0,
+            "total": None,
+            "indexed": None,
+            "error": None,
+            "started_at": datetime.now(timezone.utc).isoformat(),
+            "completed_at": None,
+        }
+        _index_jobs[job["job_id"]] = job
+        while len(_index_jobs) > INDEX_JOB_HISTORY:
+            del _index_jobs[next(iter(_index_jobs))]
+        # A plain function task runs in the threadpool once the 202 is sent
+        background_tasks.add_task(_run_index_job, job, _semantic_search, chunks_path)
+        return job
+    
+    @app.get("/semantic/index/{job_id}")
+    async def index_status(job_id: str):
+        """Get the progress of a semantic indexing job."""
+        job = _index_jobs.get(job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail=f"Indexing job '{job_id}' not found")
+        return job
     
     @app.get("/semantic/stats")
     async def get_semantic_stats():
@@ -549,239 +1022,29 @@ def create_app(
                 detail="Semantic search not available"
             )
         
-        return _semantic_search.get_stats()
+        stats = await run_in_threadpool(_semantic_search.get_stats)
+        stats["query_cache"] = _query_cache.stats()
+        return stats
 
     # Knowledge Graph
-    @app.get("/graph/data")
+    @app.get("/graph/data", dependencies=[Depends(_etag_guard)])
     async def get_graph_data() -> dict[str, Any]:
         """
         Returns nodes and edges for the knowledge graph visualization.
         Builds a graph from schemas, services, APIs, dependencies, and data flows.
         """
-        if not _kb_data:
+        global _graph_cache
+        kb_data = _kb_data
+        if not kb_data:
             raise HTTPException(status_code=503, detail="Knowledge base not loaded")
 
-        nodes: list[dict[str, Any]] = []
-        edges: list[dict[str, Any]] = []
-        node_ids: set[str] = set()
-
-        # Helper to add a node only once
-        def add_node(
-            node_id: str,
-            label: str,
-            node_type: str,
-            repo: str | None = None,
-            metadata: dict[str, Any] | None = None,
-        ) -> None:
-            if node_id not in node_ids:
-                node_ids.add(node_id)
-                node: dict[str, Any] = {
-                    "id": node_id,
-                    "label": label,
-                    "type": node_type,
-                }
-                if repo is not None:
-                    node["repo"] = repo
-                node["metadata"] = metadata or {}
-                nodes.append(node)
-
-        # --- Schema nodes ---
-        for schema in _kb_data.get("schemas", []):
-            name = schema.get("name", "unknown")
-            repo = schema.get("repo", "")
-            node_id = f"schema:{name}"
-            add_node(
-                node_id,
-                label=name,
-                node_type="schema",
-                repo=repo,
-                metadata={
-                    "type": schema.get("type", ""),
-                    "source_file": schema.get("source_file", ""),
-                    "fields": schema.get("fields", []),
-                },
-            )
-
-        # --- Service nodes ---
-        for service in _kb_data.get("services", []):
-            name = service.get("name", "unknown")
-            repo = service.get("repo", "")
-            node_id = f"service:{name}"
-            add_node(
-                node_id,
-                label=name,
-                node_type="service",
-                repo=repo,
-                metadata={
-                    "type": service.get("type", ""),
-                    "source_file": service.get("source_file", ""),
-                    "description": service.get("description", ""),
-                    "methods": service.get("methods", []),
-                },
-            )
-
-        # --- API nodes ---
-        for api in _kb_data.get("apis", []):
-            method = api.get("method", "")
-            path = api.get("path", "")
-            repo = api.get("repo", "")
-            label = f"{method} {path}" if method else path
-            node_id = f"api:{label}"
-            add_node(
-                node_id,
-                label=label,
-                node_type="api",
-                repo=repo,
-                metadata={
-                    "handler": api.get("handler", ""),
-                    "source_file": api.get("source_file", ""),
-                    "description": api.get("description", ""),
-                    "params": api.get("params", []),
-                },
-            )
-
-        # --- Dependency nodes (top 50 most used) ---
-        dep_counter: Counter[str] = Counter()
-        dep_records: dict[str, dict[str, Any]] = {}
-        for dep in _kb_data.get("dependencies", []):
-            name = dep.get("name", "")
-            if name:
-                dep_counter[name] += 1
-                if name not in dep_records:
-                    dep_records[name] = dep
-
-        top_deps = dep_counter.most_common(50)
-        for dep_name, count in top_deps:
-            dep = dep_records[dep_name]
-            node_id = f"dep:{dep_name}"
-            add_node(
-                node_id,
-                label=dep_name,
-                node_type="dependency",
-                metadata={
-                    "ecosystem": dep.get("ecosystem", ""),
-                    "version": dep.get("version", ""),
-                    "usage_count": count,
-                },
-            )
-
-        # --- Build service name lookup for matching ---
-        service_names: set[str] = set()
-        for service in _kb_data.get("services", []):
-            service_names.add(service.get("name", ""))
-
-        # --- Edges: service -> dependency service (depends_on) ---
-        for service in _kb_data.get("services", []):
-            src_name = service.get("name", "")
-            src_id = f"service:{src_name}"
-            for dep_name in service.get("dependencies", []):
-                # Check if the dependency matches a known service
-                target_id = f"service:{dep_name}"
-                if f"service:{dep_name}" in node_ids:
-                    edges.append({
-                        "source": src_id,
-                        "target": target_id,
-                        "type": "depends_on",
-                        "label": "depends on",
-                    })
-
-        # --- Edges: service -> schema (data_access) ---
-        for service in _kb_data.get("services", []):
-            src_name = service.get("name", "")
-            src_id = f"service:{src_name}"
-            for accessed in service.get("data_accessed", []):
-                accessed_name = accessed if isinstance(accessed, str) else accessed.get("name", "")
-                target_id = f"schema:{accessed_name}"
-                if target_id in node_ids:
-                    edges.append({
-                        "source": src_id,
-                        "target": target_id,
-                        "type": "data_access",
-                        "label": "reads",
-                    })
-
-        # --- Edges: schema -> schema (relationship) ---
-        for schema in _kb_data.get("schemas", []):
-            src_name = schema.get("name", "")
-            src_id = f"schema:{src_name}"
-            for rel in schema.get("relationships", []):
-                target_name = rel.get("target", "") if isinstance(rel, dict) else str(rel)
-                target_id = f"schema:{target_name}"
-                rel_label = rel.get("type", "related") if isinstance(rel, dict) else "related"
-                if target_id in node_ids:
-                    edges.append({
-                        "source": src_id,
-                        "target": target_id,
-                        "type": "relationship",
-                        "label": rel_label,
-                    })
-
-        # --- Edges: API -> service (handler) ---
-        for api in _kb_data.get("apis", []):
-            handler = api.get("handler", "")
-            if not handler:
-                continue
-            method = api.get("method", "")
-            path = api.get("path", "")
-            label = f"{method} {path}" if method else path
-            src_id = f"api:{label}"
-
-            # Try to match handler to a service name
-            matched_service: str | None = None
-            for svc_name in service_names:
-                if svc_name and (
-                    svc_name.lower() in handler.lower()
-                    or handler.lower() in svc_name.lower()
-                ):
-                    matched_service = svc_name
-                    break
-
-            if matched_service:
-                edges.append({
-                    "source": src_id,
-                    "target": f"service:{matched_service}",
-                    "type": "handler",
-                    "label": "handled by",
-                })
-
-        # --- Edges: data flows ---
-        for flow in _kb_data.get("data_flows", []):
-            source_name = flow.get("source", "")
-            target_name = flow.get("target", "")
-            if source_name and target_name:
-                # Try to resolve to existing node ids
-                source_id = (
-                    f"service:{source_name}"
-                    if f"service:{source_name}" in node_ids
-                    else source_name
-                )
-                target_id = (
-                    f"service:{target_name}"
-                    if f"service:{target_name}" in node_ids
-                    else target_name
-                )
-                edges.append({
-                    "source": source_id,
-                    "target": target_id,
-                    "type": "data_flow",
-                    "label": flow.get("description", "data flow"),
-                })
-
-        # --- Stats ---
-        node_type_counts: dict[str, int] = {}
-        for node in nodes:
-            t = node["type"]
-            node_type_counts[t] = node_type_counts.get(t, 0) + 1
-
-        return {
-            "nodes": nodes,
-            "edges": edges,
-            "stats": {
-                "total_nodes": len(nodes),
-                "total_edges": len(edges),
-                "node_types": node_type_counts,
-            },
-        }
+        # The graph only changes with the knowledge base: build and
+        # serialize it once per load
+        cached = _graph_cache
+        if cached is None or cached[0] is not kb_data:
+            graph = await run_in_threadpool(_build_graph, kb_data)
+            cached = _graph_cache = (kb_data, orjson.dumps(graph, option=orjson.OPT_NON_STR_KEYS))
+        return Response(cached[1], media_type="application/json", headers=_cache_headers())
 
     # Data Flows
     @app.get("/data-flows")
@@ -819,81 +1082,24 @@ def create_app(
                         "repo": repo,
                     })
 
-        return {
+        return OrjsonResponse({
             "flows": flows,
             "count": len(flows),
-        }
+        })
 
     # Repositories
-    @app.get("/repos")
+    @app.get("/repos", dependencies=[Depends(_etag_guard)])
     async def list_repos() -> dict[str, Any]:
         """Returns list of repositories with per-repo stats."""
         if not _kb_data:
             raise HTTPException(status_code=503, detail="Knowledge base not loaded")
 
-        repo_stats: dict[str, dict[str, Any]] = {}
-
-        def ensure_repo(name: str) -> dict[str, Any]:
-            if name not in repo_stats:
-                repo_stats[name] = {
-                    "name": name,
-                    "schemas": 0,
-                    "apis": 0,
-                    "services": 0,
-                    "dependencies": 0,
-                    "languages": {},
-                    "has_context": False,
-                    "purpose": "",
-                }
-            return repo_stats[name]
-
-        # Count schemas per repo
-        for schema in _kb_data.get("schemas", []):
-            repo = schema.get("repo", "unknown")
-            ensure_repo(repo)["schemas"] += 1
-
-        # Count APIs per repo
-        for api in _kb_data.get("apis", []):
-            repo = api.get("repo", "unknown")
-            ensure_repo(repo)["apis"] += 1
-
-        # Count services per repo
-        for service in _kb_data.get("services", []):
-            repo = service.get("repo", "unknown")
-            ensure_repo(repo)["services"] += 1
-
-        # Count dependencies per repo and track languages
-        for dep in _kb_data.get("dependencies", []):
-            repo = dep.get("repo", "unknown")
-            stats = ensure_repo(repo)
-            stats["dependencies"] += 1
-            ecosystem = dep.get("ecosystem", "")
-            if ecosystem:
-                stats["languages"][ecosystem] = stats["languages"].get(ecosystem, 0) + 1
-
-        # Also gather language info from the summary or per-repo metadata if available
-        for repo_info in _kb_data.get("repositories", []):
-            name = repo_info.get("name", "")
-            if name:
-                stats = ensure_repo(name)
-                languages = repo_info.get("languages", {})
-                if languages:
-                    stats["languages"] = languages
-
-        # Add context info to repos
-        for ctx in _kb_data.get("contexts", []):
-            repo_name = ctx.get("repo_name", "")
-            if repo_name:
-                stats = ensure_repo(repo_name)
-                stats["has_context"] = True
-                stats["purpose"] = ctx.get("purpose", "")
-
-        repos_list = sorted(repo_stats.values(), key=lambda r: r["name"])
-
-        return {
+        # Aggregated once per load by the KB index
+        repos_list = _kb_index.repo_stats
+        return OrjsonResponse({
             "repos": repos_list,
             "count": len(repos_list),
-        }
+        }, headers=_cache_headers())
 
     # Context endpoints
     @app.get("/contexts")
@@ -903,7 +1109,7 @@ def create_app(
             raise HTTPException(status_code=503, detail="Knowledge base not loaded")
 
         contexts = _kb_data.get("contexts", [])
-        return {
+        return OrjsonResponse({
             "contexts": [
                 {
                     "repo_name": c.get("repo_name", ""),
@@ -916,7 +1122,7 @@ def create_app(
                 for c in contexts
             ],
             "count": len(contexts),
-        }
+        })
 
     @app.get("/repos/{name}/context")
     async def get_repo_context(name: str):
@@ -924,10 +1130,9 @@ def create_app(
         if not _kb_data:
             raise HTTPException(status_code=503, detail="Knowledge base not loaded")
 
-        contexts = _kb_data.get("contexts", [])
-        for ctx in contexts:
-            if ctx.get("repo_name", "").lower() == name.lower():
-                return ctx
+        ctx = _kb_index.contexts_by_repo.get(name.lower())
+        if ctx is not None:
+            return ctx
 
         raise HTTPException(status_code=404, detail=f"Context for repo '{name}' not found")
 
@@ -946,62 +1151,88 @@ def create_app(
         """Business glossary: all entity definitions across repos."""
         if not _kb_data:
             raise HTTPException(status_code=503, detail="Knowledge base not loaded")
-        combined = []
-        for sl in _kb_data.get("semantic_layers", []):
-            for entry in sl.get("business_glossary", []):
-                entry_copy = dict(entry)
-                entry_copy["repo"] = sl.get("repo_name", "")
-                combined.append(entry_copy)
-        return {"glossary": combined, "count": len(combined)}
+        glossary = _kb_index.glossary
+        return OrjsonResponse({"glossary": glossary, "count": len(glossary)})
 
     @app.get("/semantic/recipes")
     async def get_query_recipes(
         q: str | None = None,
         repo: str | None = None,
         limit: int = 50,
+        offset: Annotated[int, Query(ge=0)] = 0,
     ):
         """Query recipes: how to answer business questions using the system."""
         if not _kb_data:
             raise HTTPException(status_code=503, detail="Knowledge base not loaded")
-        recipes = []
-        for sl in _kb_data.get("semantic_layers", []):
-            for recipe in sl.get("query_recipes", []):
-                recipe_copy = dict(recipe)
-                recipe_copy["repo"] = sl.get("repo_name", "")
-                recipes.append(recipe_copy)
-        if repo:
-            recipes = [r for r in recipes if repo.lower() in r.get("repo", "").lower()]
-        if q:
-            q_lower = q.lower()
-            recipes = [r for r in recipes if q_lower in r.get("question", "").lower()]
-        return {"recipes": recipes[:limit], "count": len(recipes)}
+        if q or repo:
+            recipes = list(_kb_index.find_recipes(question=q, repo=repo))
+        else:
+            recipes = _kb_index.recipes.rows
+        return OrjsonResponse({"recipes": recipes[offset:offset + limit], "count": len(recipes)})
 
     @app.get("/repos/{name}/semantic")
     async def get_repo_semantic(name: str):
         """Get semantic business layer for a specific repo."""
         if not _kb_data:
             raise HTTPException(status_code=503, detail="Knowledge base not loaded")
-        for sl in _kb_data.get("semantic_layers", []):
-            if sl.get("repo_name", "").lower() == name.lower():
-                return sl
+        layer = _kb_index.semantic_layers_by_repo.get(name.lower())
+        if layer is not None:
+            return layer
         raise HTTPException(status_code=404, detail=f"Semantic layer for '{name}' not found")
 
     # ---- Config Helpers ----
 
+    # ((mtime_ns, size) of the config file, its parsed contents)
+    config_cache: tuple[tuple[int, int], dict] | None = None
+    # Endpoint responses built from the config, per builder: (config stamp, response)
+    config_views: dict[Callable, tuple[tuple[int, int] | None, Any]] = {}
+
+    def _config_stamp() -> tuple[int, int] | None:
+        """(mtime_ns, size) of the config file, or None if it does not exist."""
+        try:
+            st = Path(config_path).stat()
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
     def _read_config() -> dict:
-        """Read the current config from disk."""
-        import yaml
-        config_file = Path(config_path)
-        if not config_file.exists():
+        """Read the current config from disk.
+
+        The parsed file is kept until its mtime or size changes; callers
+        get their own copy, since they edit it before writing it back.
+        """
+        nonlocal config_cache
+        stamp = _config_stamp()
+        if stamp is None:
             return {}
-        return yaml.safe_load(config_file.read_text()) or {}
+        if config_cache is None or config_cache[0] != stamp:
+            config_file = Path(config_path)
+            config_cache = (stamp, yaml.load(config_file.read_text(), Loader=YAML_LOADER) or {})
+        return copy.deepcopy(config_cache[1])
 
     def _write_config(config: dict) -> None:
-        """Write the config back to disk."""
-        import yaml
+        """Write the config back to disk.
+
+        The written dict becomes the cached parse, so the next read does not
+        go back to YAML; views are rebuilt from it on their next request.
+        """
+        nonlocal config_cache
         config_file = Path(config_path)
         config_file.parent.mkdir(parents=True, exist_ok=True)
-        config_file.write_text(yaml.dump(config, default_flow_style=False, sort_keys=False))
+        config_file.write_text(yaml.dump(config, Dumper=YAML_DUMPER, default_flow_style=False, sort_keys=False))
+        config_cache = (_config_stamp(), copy.deepcopy(config))
+        config_views.clear()
+
+    def _config_view(build: Callable[[dict], Any]) -> Any:
+        """Return ``build(config)``, reused until the config file changes.
+
+        The result is shared between requests and must not be mutated.
+        """
+        stamp = _config_stamp()
+        cached = config_views.get(build)
+        if cached is None or cached[0] != stamp:
+            cached = config_views[build] = (stamp, build(_read_config()))
+        return cached[1]
 
     # ---- Sources Config Endpoints ----
 
@@ -1068,10 +1299,8 @@ def create_app(
             )
         return None
 
-    @app.get("/config/sources", response_model=SourcesResponse)
-    async def get_sources():
-        """Get all configured repository sources."""
-        cfg = _read_config()
+    def _sources_response(cfg: dict) -> SourcesResponse:
+        """Build the sources response from a config dict."""
         sources = []
         for t in ("github", "gitlab", "local"):
             src = _source_from_config(cfg, t)
@@ -1079,10 +1308,15 @@ def create_app(
                 sources.append(src)
         return SourcesResponse(sources=sources)
 
+    @app.get("/config/sources", response_model=SourcesResponse)
+    async def get_sources():
+        """Get all configured repository sources."""
+        return await run_in_threadpool(_config_view, _sources_response)
+
     @app.post("/config/sources", response_model=SourcesResponse)
     async def add_source(request: AddSourceRequest):
         """Add or update a repository source."""
-        cfg = _read_config()
+        cfg = await run_in_threadpool(_read_config)
         src = request.source
 
         if src.type == "github":
@@ -1120,34 +1354,23 @@ def create_app(
         if src.exclude_patterns is not None:
             cfg[src.type]["exclude_patterns"] = src.exclude_patterns
 
-        _write_config(cfg)
+        await run_in_threadpool(_write_config, cfg)
 
         # Return full list
-        sources = []
-        for t in ("github", "gitlab", "local"):
-            s = _source_from_config(cfg, t)
-            if s:
-                sources.append(s)
-        return SourcesResponse(sources=sources)
+        return _sources_response(cfg)
 
     @app.delete("/config/sources/{source_type}", response_model=SourcesResponse)
     async def remove_source(source_type: str):
         """Remove a repository source by type."""
-        cfg = _read_config()
+        cfg = await run_in_threadpool(_read_config)
         if source_type not in ("github", "gitlab", "local"):
             raise HTTPException(status_code=400, detail=f"Unknown source type: {source_type}")
         if source_type not in cfg:
             raise HTTPException(status_code=404, detail=f"Source '{source_type}' not configured")
 
         del cfg[source_type]
-        _write_config(cfg)
-
-        sources = []
-        for t in ("github", "gitlab", "local"):
-            s = _source_from_config(cfg, t)
-            if s:
-                sources.append(s)
-        return SourcesResponse(sources=sources)
+        await run_in_threadpool(_write_config, cfg)
+        return _sources_response(cfg)
 
     # ---- LLM Config Endpoints ----
 
@@ -1162,6 +1385,9 @@ def create_app(
         api_key: str | None = Field(None, description="API key (omit to keep existing)")
         model: str | None = Field(None, description="Model name override")
 
+    # Checked once: the server's environment does not change while it runs
+    env_api_key_set = any(os.environ.get(name) for name in LLM_KEY_ENV_VARS)
+
     def _build_llm_config_response(cfg: dict) -> LLMConfigResponse:
         """Build LLM config response from config dict + env vars."""
         llm = cfg.get("llm", {})
@@ -1169,21 +1395,8 @@ def create_app(
         model = llm.get("model")
 
         # Determine API key status and source
-        api_key_set = False
-        api_key_source = None
-
-        if llm.get("api_key"):
-            api_key_set = True
-            api_key_source = "config"
-        elif os.environ.get("ANTHROPIC_API_KEY"):
-            api_key_set = True
-            api_key_source = "env"
-        elif os.environ.get("OPENAI_API_KEY"):
-            api_key_set = True
-            api_key_source = "env"
-        elif os.environ.get("AWS_ACCESS_KEY_ID"):
-            api_key_set = True
-            api_key_source = "env"
+        api_key_source = "config" if llm.get("api_key") else "env" if env_api_key_set else None
+        api_key_set = api_key_source is not None
 
         return LLMConfigResponse(
             provider=provider,
@@ -1195,13 +1408,12 @@ def create_app(
     @app.get("/config/llm", response_model=LLMConfigResponse)
     async def get_llm_config():
         """Get current LLM provider configuration."""
-        cfg = _read_config()
-        return _build_llm_config_response(cfg)
+        return await run_in_threadpool(_config_view, _build_llm_config_response)
 
     @app.put("/config/llm", response_model=LLMConfigResponse)
     async def update_llm_config(request: LLMConfigUpdate):
         """Update LLM provider settings."""
-        cfg = _read_config()
+        cfg = await run_in_threadpool(_read_config)
 
         if "llm" not in cfg:
             cfg["llm"] = {}
@@ -1215,7 +1427,7 @@ def create_app(
         if request.model:
             cfg["llm"]["model"] = request.model
 
-        _write_config(cfg)
+        await run_in_threadpool(_write_config, cfg)
         return _build_llm_config_response(cfg)
 
     # ---- Backward-compat: local-dirs endpoints ----
@@ -1227,10 +1439,8 @@ def create_app(
     class LocalDirsUpdate(BaseModel):
         dirs: list[str] = Field(..., description="List of local directory paths to scan for repos")
 
-    @app.get("/config/local-dirs", response_model=LocalDirsResponse)
-    async def get_local_dirs():
-        """Get the currently configured local repository directories."""
-        cfg = _read_config()
+    def _local_dirs_response(cfg: dict) -> LocalDirsResponse:
+        """Build the local-dirs response from a config dict."""
         local_cfg = cfg.get("local", {})
         raw = local_cfg.get("repos_path", [])
         if isinstance(raw, str):
@@ -1241,10 +1451,15 @@ def create_app(
         platform = "local" if "local" in cfg else "github" if "github" in cfg else "gitlab" if "gitlab" in cfg else ""
         return LocalDirsResponse(dirs=dirs, platform=platform)
 
+    @app.get("/config/local-dirs", response_model=LocalDirsResponse)
+    async def get_local_dirs():
+        """Get the currently configured local repository directories."""
+        return await run_in_threadpool(_config_view, _local_dirs_response)
+
     @app.put("/config/local-dirs", response_model=LocalDirsResponse)
     async def update_local_dirs(request: LocalDirsUpdate):
         """Update the list of local repository directories in the config."""
-        cfg = _read_config()
+        cfg = await run_in_threadpool(_read_config)
 
         if "local" not in cfg:
             cfg["local"] = {}
@@ -1255,7 +1470,7 @@ def create_app(
         if "exclude_patterns" not in cfg["local"]:
             cfg["local"]["exclude_patterns"] = ["^\\."]
 
-        _write_config(cfg)
+        await run_in_threadpool(_write_config, cfg)
 
         platform = "local" if "local" in cfg else "github" if "github" in cfg else "gitlab" if "gitlab" in cfg else ""
         return LocalDirsResponse(dirs=dirs, platform=platform)
@@ -1264,27 +1479,24 @@ def create_app(
 
     _crawl_manager = CrawlManager(config_path=config_path)
 
+    # Semantic reloads run one at a time, off the crawl thread
+    semantic_reloads = ThreadPoolExecutor(max_workers=1, thread_name_prefix="semantic-reload")
+    pending_semantic_reload: Future | None = None
+
     def _reload_kb():
-        """Reload knowledge base from disk after crawl completes."""
-        global _search_engine, _semantic_search, _kb_data
-        _search_engine = SearchEngine(kb_path)
-        _kb_data = _search_engine.data
+        """Reload knowledge base from disk after crawl completes.
+
+        Keyword search is reloaded before returning; semantic search is
+        reloaded in the background and keeps serving the previous index
+        until the new one is warm. A reload still waiting to start covers
+        any further requests.
+        """
+        nonlocal pending_semantic_reload
+        _load_keyword_search()
         if enable_semantic:
-            try:
-                from ..query.embeddings import SemanticSearch
-                _semantic_search = SemanticSearch(persist_dir=chroma_path)
-                count = _semantic_search.collection.count()
-
-                # Auto-index if ChromaDB is empty but chunks.json exists
-                if count == 0:
-                    chunks_path = Path(chroma_path).parent / "chunks.json"
-                    if chunks_path.exists():
-                        logger.info("ChromaDB empty, auto-indexing from %s...", chunks_path)
-                        indexed = _semantic_search.index_chunks(chunks_path)
-                        logger.info("Indexed %d chunks into ChromaDB", indexed)
-            except Exception as e:
-                logger.warning("Semantic search reload failed: %s", e)
-                _semantic_search = None
+            pending = pending_semantic_reload
+            if pending is None or pending.running() or pending.done():
+                pending_semantic_reload = semantic_reloads.submit(_load_semantic_search)
 
     _crawl_manager.set_on_complete(_reload_kb)
 
@@ -1308,12 +1520,25 @@ def create_app(
     async def crawl_stream():
         """SSE stream of crawl progress updates."""
         async def event_generator():
+            seen = _crawl_manager.changes
+            last_status = last_frame = None
             while True:
                 status = _crawl_manager.get_status()
-                yield f"data: {json.dumps(status)}\n\n"
+                # get_status returns the same dict until the job changes, so
+                # only a new dict needs encoding, and only a new frame sending
+                if status is not last_status:
+                    last_status = status
+                    frame = b"data: " + orjson.dumps(status) + b"\n\n"
+                    if frame != last_frame:
+                        last_frame = frame
+                        yield frame
                 if status["status"] in ("completed", "failed", "idle"):
                     break
-                await asyncio.sleep(1)
+                # Push the next frame as soon as the job changes; keep idle
+                # connections open through proxies with comment lines
+                while (changes := await _crawl_manager.wait_for_change(seen, SSE_HEARTBEAT_INTERVAL)) == seen:
+                    yield b": keepalive\n\n"
+                seen = changes
 
         return StreamingResponse(
             event_generator(),
@@ -1337,17 +1562,28 @@ def create_app(
 
         @app.get("/")
         async def root_redirect():
-            from fastapi.responses import RedirectResponse
             return RedirectResponse(url="/app")
     else:
         @app.get("/")
         async def root_redirect():
-            from fastapi.responses import RedirectResponse
             return RedirectResponse(url="/docs")
 
     return app
 
 
+# Environment variable carrying create_app() arguments to worker processes
+SETTINGS_ENV = "SENSEBASE_API_SETTINGS"
+
+
+def create_app_from_env() -> FastAPI:
+    """Create the application from the settings ``main()`` put in the environment.
+
+    Used as the app factory when uvicorn runs several workers or reloads,
+    since each worker process imports and builds its own application.
+    """
+    return create_app(**orjson.loads(os.environ.get(SETTINGS_ENV, "{}")))
+
+
 def main():
     """Run the API server."""
     import argparse
@@ -1360,22 +1596,52 @@ def main():
     parser.add_argument("--chroma", default="./output/vectors/chroma", help="ChromaDB path")
     parser.add_argument("--no-semantic", action="store_true", help="Disable semantic search")
     parser.add_argument("--config", default="config/config.yaml", help="Config file path")
+    parser.add_argument(
+        "--semantic-cache-threshold", type=float, default=0.95,
+        help="Cosine similarity at which a semantic query reuses cached results",
+    )
     parser.add_argument("--reload", action="store_true", help="Enable auto-reload")
+    parser.add_argument(
+        "--workers", "-w", type=int, default=1,
+        help="Worker processes, each with its own knowledge base and embedding model",
+    )
+    parser.add_argument(
+        "--no-access-log", action="store_true",
+        help="Disable per-request access logging (faster under heavy load)",
+    )
+    parser.add_argument(
+        "--keep-alive", type=int, default=5,
+        help="Seconds to keep idle HTTP connections open for reuse",
+    )
 
     args = parser.parse_args()
 
-    app = create_app(
-        kb_path=args.kb,
-        chroma_path=args.chroma,
-        enable_semantic=not args.no_semantic,
-        config_path=args.config,
-    )
+    settings = {
+        "kb_path": args.kb,
+        "chroma_path": args.chroma,
+        "enable_semantic": not args.no_semantic,
+        "config_path": args.config,
+        "semantic_cache_threshold": args.semantic_cache_threshold,
+    }
+    if args.workers > 1 or args.reload:
+        # Worker processes build their own app from an import string
+        os.environ[SETTINGS_ENV] = orjson.dumps(settings).decode()
+        app, factory = f"{__name__}:create_app_from_env", True
+    else:
+        app, factory = create_app(**settings), False
     
     uvicorn.run(
         app,
+        factory=factory,
         host=args.host,
         port=args.port,
         reload=args.reload,
+        workers=args.workers,
+        access_log=not args.no_access_log,
+        timeout_keep_alive=args.keep_alive,
+        # uvicorn[standard] installs both; without them use the pure-Python defaults
+        loop="uvloop" if importlib.util.find_spec("uvloop") else "auto",
+        http="httptools" if importlib.util.find_spec("httptools") else "auto",
     )
 
 
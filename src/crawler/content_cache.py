@@ -0,0 +1,46 @@
+"""Size-bounded cache for file contents fetched from platform APIs."""
+
+import threading
+from collections import OrderedDict
+from typing import Hashable
+
+# Default budget for cached file text, in characters
+DEFAULT_MAX_CHARS = 32 * 1024 * 1024
+
+
+class FileContentCache:
+    """LRU cache of file text, bounded by total size rather than entry count.
+
+    Crawls ask for the same few files (``package.json``, ``README.md``, ...)
+    repeatedly; counting size keeps a handful of huge files from pushing
+    everything else out or growing memory without bound. Files larger than
+    the whole budget are never cached. Safe to share between threads.
+    """
+
+    def __init__(self, max_chars: int = DEFAULT_MAX_CHARS):
+        self.max_chars = max_chars
+        self._entries: OrderedDict[Hashable, str] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> str | None:
+        """Return the cached text for *key*, or None."""
+        with self._lock:
+            text = self._entries.get(key)
+            if text is not None:
+                self._entries.move_to_end(key)
+            return text
+
+    def put(self, key: Hashable, text: str) -> None:
+        """Cache *text* under *key*, evicting least recently used entries."""
+        if len(text) > self.max_chars:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= len(old)
+            self._entries[key] = text
+            self._size += len(text)
+            while self._size > self.max_chars:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
@@ -0,0 +1,47 @@
+"""Repository name filters shared by the crawlers."""
+
+import re
+
+# Global inline flags such as "(?i)", which are only legal at the start of a pattern
+_LEADING_FLAGS = re.compile(r"\(\?([aiLmsux]+)\)")
+
+
+class _AnyPattern:
+    """Matches where any of several compiled patterns does (``search`` only)."""
+
+    def __init__(self, patterns: list[re.Pattern]):
+        self.patterns = patterns
+
+    def search(self, string: str) -> re.Match | None:
+        for pattern in self.patterns:
+            match = pattern.search(string)
+            if match:
+                return match
+        return None
+
+
+def _scoped(pattern: str) -> str:
+    """Wrap *pattern* in a group, turning leading inline flags into scoped ones."""
+    m = _LEADING_FLAGS.match(pattern)
+    if m:
+        return f"(?{m.group(1)}:{pattern[m.end():]})"
+    return f"(?:{pattern})"
+
+
+def compile_exclusions(patterns: list[str] | None) -> re.Pattern | _AnyPattern | None:
+    """Compile exclude *patterns* into one matcher, or None if there are none.
+
+    ``search`` on the result matches wherever any single pattern would.
+    Patterns without capturing groups are fused into one regex, so a name
+    is checked in one pass instead of one per pattern. Patterns with groups
+    are matched on their own, since group names and numbered
+    backreferences would clash or shift once patterns are joined.
+    """
+    if not patterns:
+        return None
+    compiled = [re.compile(pattern) for pattern in patterns]
+    fusable = [p.pattern for p in compiled if not p.groups]
+    separate = [p for p in compiled if p.groups]
+    if fusable:
+        separate.insert(0, re.compile("|".join(_scoped(p) for p in fusable)))
+    return separate[0] if len(separate) == 1 else _AnyPattern(separate)
@@ -1,15 +1,21 @@
 """GitHub API client for repository discovery and access."""
 
-import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import Iterator
 
 from github import Auth, Github, GithubException
 from rich.console import Console
 
+from .content_cache import FileContentCache
+from .filters import compile_exclusions
 from .models import RepoInfo
 
 console = Console()
 
+# Git tree entry types as the contents API names them
+_TREE_ENTRY_TYPES = {"blob": "file", "tree": "dir", "commit": "submodule"}
+
 
 class GitHubClient:
     """Client for interacting with GitHub API."""
@@ -19,12 +25,15 @@ class GitHubClient:
         token: str,
         orgs: list[str] | None = None,
         exclude_patterns: list[str] | None = None,
+        concurrency: int = 8,
     ):
         self.gh = Github(auth=Auth.Token(token))
         self.orgs = orgs or []
-        self.exclude_patterns = [
-            re.compile(p) for p in (exclude_patterns or [])
-        ]
+        self._org_set = frozenset(self.orgs)
+        self.exclude = compile_exclusions(exclude_patterns)
+        self.concurrency = concurrency
+        self._repos: dict[str, object] = {}
+        self._contents = FileContentCache()
 
     def authenticate(self) -> bool:
         """Verify authentication and connection."""
@@ -40,20 +49,25 @@ class GitHubClient:
     def _should_include(self, repo_full_name: str) -> bool:
         """Check if repository should be included based on filters."""
         if self.orgs:
-            owner = repo_full_name.split("/")[0]
-            if not any(owner == org for org in self.orgs):
-                return False
-
-        for pattern in self.exclude_patterns:
-            if pattern.search(repo_full_name):
+            owner = repo_full_name.partition("/")[0]
+            if owner not in self._org_set:
                 return False
 
-        return True
+        return not (self.exclude and self.exclude.search(repo_full_name))
 
     def discover_projects(self) -> Iterator[RepoInfo]:
-        """Discover all accessible repositories."""
+        """Discover all accessible repositories.
+
+        Each repository costs an extra API call for its languages, so up to
+        ``concurrency`` of those run at once; results keep listing order.
+        """
         console.print("[blue]Discovering repositories...[/blue]")
 
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            yield from executor.map(self._repo_to_info, self._candidate_repos())
+
+    def _candidate_repos(self) -> Iterator:
+        """Yield the unarchived, included PyGithub repositories to discover."""
         if self.orgs:
             for org_name in self.orgs:
                 try:
@@ -73,7 +87,7 @@ class GitHubClient:
                         continue
                     if not self._should_include(repo.full_name):
                         continue
-                    yield self._repo_to_info(repo)
+                    yield repo
         else:
             user = self.gh.get_user()
             for repo in user.get_repos(sort="updated", direction="desc"):
@@ -81,7 +95,7 @@ class GitHubClient:
                     continue
                 if not self._should_include(repo.full_name):
                     continue
-                yield self._repo_to_info(repo)
+                yield repo
 
     def _repo_to_info(self, repo) -> RepoInfo:
         """Convert a PyGithub repository object to RepoInfo."""
@@ -102,23 +116,48 @@ class GitHubClient:
             http_url=repo.clone_url,
             ssh_url=repo.ssh_url,
             languages=languages,
-            topics=repo.get_topics(),
+            # Listing responses already carry topics, unlike get_topics()
+            topics=repo.topics or [],
             last_activity=repo.updated_at.isoformat() if repo.updated_at else "",
         )
 
+    def _get_repo(self, repo_full_name: str):
+        """Return the PyGithub repository, fetching it once per client."""
+        repo = self._repos.get(repo_full_name)
+        if repo is None:
+            repo = self._repos[repo_full_name] = self.gh.get_repo(repo_full_name)
+        return repo
+
     def get_project_files(
         self,
         repo_full_name: str,
         branch: str = "main",
         path: str = "",
     ) -> Iterator[dict]:
-        """Get file tree for a repository without cloning."""
-        repo = self.gh.get_repo(repo_full_name)
+        """Get file tree for a repository without cloning.
+
+        The whole tree comes from one recursive Git Trees API call; only
+        when GitHub truncates that response are directories listed one
+        request at a time.
+        """
+        repo = self._get_repo(repo_full_name)
 
         try:
-            contents = repo.get_contents(path, ref=branch)
+            tree = repo.get_git_tree(branch, recursive=True)
+            if not tree.raw_data.get("truncated"):
+                prefix = f"{path.strip('/')}/" if path.strip("/") else ""
+                for entry in tree.tree:
+                    if entry.path.startswith(prefix):
+                        yield {
+                            "name": entry.path.rpartition("/")[2],
+                            "path": entry.path,
+                            "type": _TREE_ENTRY_TYPES.get(entry.type, entry.type),
+                        }
+                return
+
+            contents = deque(repo.get_contents(path, ref=branch))
             while contents:
-                item = contents.pop(0)
+                item = contents.popleft()
                 yield {"name": item.name, "path": item.path, "type": item.type}
                 if item.type == "dir":
                     contents.extend(repo.get_contents(item.path, ref=branch))
@@ -133,11 +172,16 @@ class GitHubClient:
         file_path: str,
         branch: str = "main",
     ) -> str | None:
-        """Get raw file content."""
-        repo = self.gh.get_repo(repo_full_name)
+        """Get raw file content, cached per (repo, path, branch)."""
+        key = (repo_full_name, file_path, branch)
+        text = self._contents.get(key)
+        if text is not None:
+            return text
 
         try:
-            content = repo.get_contents(file_path, ref=branch)
-            return content.decoded_content.decode("utf-8")
+            content = self._get_repo(repo_full_name).get_contents(file_path, ref=branch)
+            text = content.decoded_content.decode("utf-8")
         except Exception:
             return None
+        self._contents.put(key, text)
+        return text
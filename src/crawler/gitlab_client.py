@@ -1,11 +1,12 @@
 """GitLab API client for repository discovery and access."""
 
-import re
 from typing import Iterator
 
 import gitlab
 from rich.console import Console
 
+from .content_cache import FileContentCache
+from .filters import compile_exclusions
 from .models import RepoInfo
 
 console = Console()
@@ -25,9 +26,10 @@ class GitLabClient:
         self.url = url
         self.gl = gitlab.Gitlab(url, private_token=token)
         self.namespaces = namespaces or []
-        self.exclude_patterns = [
-            re.compile(p) for p in (exclude_patterns or [])
-        ]
+        self._namespace_prefixes = tuple(self.namespaces)
+        self.exclude = compile_exclusions(exclude_patterns)
+        self._projects: dict[int, object] = {}
+        self._contents = FileContentCache()
         
     def authenticate(self) -> bool:
         """Verify authentication and connection."""
@@ -44,15 +46,11 @@ class GitLabClient:
         """Check if project should be included based on filters."""
         # Check namespace filter
         if self.namespaces:
-            if not any(project_path.startswith(ns) for ns in self.namespaces):
+            if not project_path.startswith(self._namespace_prefixes):
                 return False
         
         # Check exclusion patterns
-        for pattern in self.exclude_patterns:
-            if pattern.search(project_path):
-                return False
-        
-        return True
+        return not (self.exclude and self.exclude.search(project_path))
     
     def discover_projects(self) -> Iterator[RepoInfo]:
         """Discover all accessible projects."""
@@ -90,6 +88,13 @@ class GitLabClient:
                 last_activity=project.last_activity_at,
             )
     
+    def _get_project(self, project_id: int):
+        """Return the python-gitlab project, fetching it once per client."""
+        project = self._projects.get(project_id)
+        if project is None:
+            project = self._projects[project_id] = self.gl.projects.get(project_id)
+        return project
+    
     def get_project_files(
         self,
         project_id: int,
@@ -97,7 +102,7 @@ class GitLabClient:
         path: str = "",
     ) -> Iterator[dict]:
         """Get file tree for a project without cloning."""
-        project = self.gl.projects.get(project_id)
+        project = self._get_project(project_id)
         
         try:
             items = project.repository_tree(
@@ -117,11 +122,16 @@ class GitLabClient:
         file_path: str,
         branch: str = "main",
     ) -> str | None:
-        """Get raw file content."""
-        project = self.gl.projects.get(project_id)
+        """Get raw file content, cached per (project, path, branch)."""
+        key = (project_id, file_path, branch)
+        text = self._contents.get(key)
+        if text is not None:
+            return text
         
         try:
-            f = project.files.get(file_path=file_path, ref=branch)
-            return f.decode().decode("utf-8")
+            f = self._get_project(project_id).files.get(file_path=file_path, ref=branch)
+            text = f.decode().decode("utf-8")
         except Exception:
             return None
+        self._contents.put(key, text)
+        return text
@@ -1,8 +1,8 @@
 """Repository cloning and management."""
 
+import asyncio
 import shutil
 import subprocess
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -13,6 +13,9 @@ from .models import RepoInfo
 
 console = Console()
 
+# Seconds a single ``git clone`` may take before it is killed
+CLONE_TIMEOUT = 300
+
 
 @dataclass
 class ClonedRepo:
@@ -43,6 +46,10 @@ class RepoManager:
     
     def clone_repo(self, repo: RepoInfo) -> ClonedRepo:
         """Clone a single repository."""
+        return asyncio.run(self._clone_repo_async(repo))
+    
+    async def _clone_repo_async(self, repo: RepoInfo) -> ClonedRepo:
+        """Clone a single repository with a ``git clone`` subprocess."""
         local_path = self.get_repo_path(repo)
         
         # Skip if already exists
@@ -56,27 +63,40 @@ class RepoManager:
         # Create parent directories
         local_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Build clone command
-        cmd = ["git", "clone"]
+        # Build clone command; tags are never read, so don't transfer them
+        cmd = ["git", "clone", "--no-tags"]
         if self.depth > 0:
             cmd.extend(["--depth", str(self.depth)])
         cmd.extend(["--branch", repo.default_branch])
         cmd.extend([repo.http_url, str(local_path)])
         
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=300,  # 5 minute timeout
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE,
             )
+            try:
+                _, stderr = await asyncio.wait_for(
+                    proc.communicate(),
+                    timeout=CLONE_TIMEOUT,
+                )
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                return ClonedRepo(
+                    info=repo,
+                    local_path=local_path,
+                    success=False,
+                    error="Clone timed out",
+                )
             
-            if result.returncode != 0:
+            if proc.returncode != 0:
                 return ClonedRepo(
                     info=repo,
                     local_path=local_path,
                     success=False,
-                    error=result.stderr,
+                    error=stderr.decode(errors="replace"),
                 )
             
             return ClonedRepo(
@@ -85,13 +105,6 @@ class RepoManager:
                 success=True,
             )
             
-        except subprocess.TimeoutExpired:
-            return ClonedRepo(
-                info=repo,
-                local_path=local_path,
-                success=False,
-                error="Clone timed out",
-            )
         except Exception as e:
             return ClonedRepo(
                 info=repo,
@@ -101,8 +114,13 @@ class RepoManager:
             )
     
     def clone_repos(self, repos: list[RepoInfo]) -> list[ClonedRepo]:
-        """Clone multiple repositories concurrently."""
+        """Clone multiple repositories concurrently.
+
+        Repositories that are already checked out are reported up front
+        instead of taking a worker slot.
+        """
         results = []
+        pending = []
         
         with Progress(
             SpinnerColumn(),
@@ -113,26 +131,39 @@ class RepoManager:
         ) as progress:
             task = progress.add_task("Cloning repos...", total=len(repos))
             
-            with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
-                futures = {
-                    executor.submit(self.clone_repo, repo): repo
-                    for repo in repos
-                }
+            def report(result: ClonedRepo) -> None:
+                results.append(result)
+                if result.success:
+                    progress.console.print(
+                        f"  [green]✓[/green] {result.info.full_path}"
+                    )
+                else:
+                    progress.console.print(
+                        f"  [red]✗[/red] {result.info.full_path}: {result.error}"
+                    )
+                progress.advance(task)
+            
+            for repo in repos:
+                local_path = self.get_repo_path(repo)
+                if (local_path / ".git").exists():
+                    report(ClonedRepo(info=repo, local_path=local_path, success=True))
+                else:
+                    pending.append(repo)
+            
+            async def clone_pending() -> None:
+                # Clones are subprocesses, so one event loop can wait on
+                # many of them without a thread per clone
+                semaphore = asyncio.Semaphore(self.concurrency)
                 
-                for future in as_completed(futures):
-                    result = future.result()
-                    results.append(result)
-                    
-                    if result.success:
-                        progress.console.print(
-                            f"  [green]✓[/green] {result.info.full_path}"
-                        )
-                    else:
-                        progress.console.print(
-                            f"  [red]✗[/red] {result.info.full_path}: {result.error}"
-                        )
-                    
-                    progress.advance(task)
+                async def clone(repo: RepoInfo) -> ClonedRepo:
+                    async with semaphore:
+                        return await self._clone_repo_async(repo)
+                
+                for next_result in asyncio.as_completed([clone(repo) for repo in pending]):
+                    report(await next_result)
+            
+            if pending:
+                asyncio.run(clone_pending())
         
         success_count = sum(1 for r in results if r.success)
         console.print(
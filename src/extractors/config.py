@@ -1,11 +1,36 @@
 """Configuration file analyzer for YAML, TOML, JSON configs."""
 
+import hashlib
 import json
 import re
+import threading
+from collections import OrderedDict
 from pathlib import Path
 
 import yaml
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson ships with the api extra
+    orjson = None
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    tomllib = None
+
+# libyaml's C loader when PyYAML was built with it; same safe subset of YAML
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsed YAML/TOML documents memoized by (suffix, content hash), so config
+# files copied between repos (CI, Helm values, compose files) are parsed
+# once. JSON is not cached: orjson parses it barely slower than it hashes.
+PARSE_CACHE_SIZE = 1024
+# Larger documents are parsed every time rather than pinned in the cache
+PARSE_CACHE_MAX_CHARS = 256 * 1024
+_PARSE_CACHE: OrderedDict[tuple[str, bytes], object] = OrderedDict()
+_PARSE_CACHE_LOCK = threading.Lock()
+
 from ..analyzers.base import (
     Analyzer,
     AnalysisResult,
@@ -13,6 +38,20 @@ from ..analyzers.base import (
 )
 
 
+def _loads_json(content: str):
+    """Parse JSON with orjson when available.
+
+    Documents orjson rejects but the stdlib accepts (NaN, integers wider
+    than 64 bits) are retried with ``json``.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(content)
+
+
 class ConfigAnalyzer(Analyzer):
     """Analyzer for configuration files."""
     
@@ -28,13 +67,16 @@ class ConfigAnalyzer(Analyzer):
             repo_path=str(file_path.parent),
             repo_name=file_path.parent.name,
         )
-        
+        self.analyze_into(file_path, content, result)
+        return result
+    
+    def analyze_into(self, file_path: Path, content: str, result: AnalysisResult) -> None:
         rel_path = str(file_path)
         
         # Parse the content
         data = self._parse_content(file_path, content)
         if data is None:
-            return result
+            return
         
         # Docker Compose
         if self.DOCKER_COMPOSE.match(file_path.name):
@@ -51,17 +93,40 @@ class ConfigAnalyzer(Analyzer):
         # Database configs
         elif 'database' in data or 'databases' in data or 'datasource' in data:
             self._analyze_database_config(data, rel_path, result)
-        
-        return result
     
     def _parse_content(self, file_path: Path, content: str) -> dict | None:
-        """Parse config file content."""
+        """Parse config file content.
+        
+        YAML and TOML documents are served from ``_PARSE_CACHE`` when the
+        same content was parsed before. Cached documents are shared between
+        files, so analysis must only read them.
+        """
+        suffix = file_path.suffix
+        if suffix == '.json' or len(content) > PARSE_CACHE_MAX_CHARS:
+            return self._parse_uncached(suffix, content)
+        
+        key = (suffix, hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest())
+        with _PARSE_CACHE_LOCK:
+            if key in _PARSE_CACHE:
+                _PARSE_CACHE.move_to_end(key)
+                return _PARSE_CACHE[key]
+        data = self._parse_uncached(suffix, content)
+        with _PARSE_CACHE_LOCK:
+            _PARSE_CACHE[key] = data
+            if len(_PARSE_CACHE) > PARSE_CACHE_SIZE:
+                _PARSE_CACHE.popitem(last=False)
+        return data
+    
+    def _parse_uncached(self, suffix: str, content: str) -> dict | None:
+        """Parse config file content by file *suffix*."""
         try:
-            if file_path.suffix in ('.yaml', '.yml'):
-                return yaml.safe_load(content)
-            elif file_path.suffix == '.json':
-                return json.loads(content)
-            elif file_path.suffix == '.toml':
+            if suffix in ('.yaml', '.yml'):
+                return yaml.load(content, Loader=_YAML_LOADER)
+            elif suffix == '.json':
+                return _loads_json(content)
+            elif suffix == '.toml':
+                if tomllib is not None:
+                    return tomllib.loads(content)
                 try:
                     import toml
                     return toml.loads(content)
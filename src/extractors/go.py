@@ -19,23 +19,22 @@ class GoAnalyzer(Analyzer):
     extensions = [".go", ".mod"]
     language = "go"
     
-    # Struct patterns
-    STRUCT_PATTERN = re.compile(
-        r'type\s+(\w+)\s+struct\s*\{([^}]+)\}',
+    # Struct and interface declarations, found in one scan: they share the
+    # "type" prefix the regex engine searches for
+    TYPE_PATTERN = re.compile(
+        r'type\s+(\w+)\s+(struct|interface)\s*\{([^}]+)\}',
         re.MULTILINE | re.DOTALL
     )
     
     # Field with tags pattern
+    # One struct field per line: name, type and an optional `tag` literal
+    # ([^\S\n] is whitespace within the line)
     FIELD_PATTERN = re.compile(
-        r'(\w+)\s+(\S+)\s*(?:`([^`]+)`)?',
+        r'^[^\S\n]*(\w+)[^\S\n]+(\S+)[^\S\n]*(?:`([^`\n]+)`)?',
         re.MULTILINE
     )
     
-    # Interface pattern
-    INTERFACE_PATTERN = re.compile(
-        r'type\s+(\w+)\s+interface\s*\{([^}]+)\}',
-        re.MULTILINE | re.DOTALL
-    )
+    JSON_TAG_PATTERN = re.compile(r'json:"([^"]+)"')
     
     # HTTP handler patterns
     HANDLER_PATTERN = re.compile(
@@ -49,103 +48,125 @@ class GoAnalyzer(Analyzer):
         re.MULTILINE
     )
     
+    # Structs ending in Service, Handler, Controller, etc.
+    SERVICE_PATTERN = re.compile(
+        r'type\s+(\w+(?:Service|Handler|Controller|Manager|Repository))\s+struct',
+        re.MULTILINE
+    )
+    
+    # Methods with a receiver: func (s *StructName) MethodName(params) returns
+    RECEIVER_METHOD_PATTERN = re.compile(
+        r'func\s+\(\w+\s+\*?(\w+)\)\s+(\w+)\s*\(([^)]*)\)\s*([^{]*)',
+        re.MULTILINE
+    )
+    
+    # go.mod lines: "require (" opens a block, a lone ")" closes it, and
+    # requirements are "module/path v1.2.3", prefixed by "require " outside
+    # a block ([^\S\n] is whitespace within the line)
+    GO_MOD_PATTERN = re.compile(
+        r'^[^\S\n]*(?:(?P<open>require \()'
+        r'|(?P<close>\))[^\S\n]*$'
+        r'|(?:require[^\S\n]+)?(?P<name>\S+)[^\S\n]+(?P<version>v\S+))',
+        re.MULTILINE
+    )
+    
     def analyze_file(self, file_path: Path, content: str) -> AnalysisResult:
         result = AnalysisResult(
             repo_path=str(file_path.parent),
             repo_name=file_path.parent.name,
         )
-        
+        self.analyze_into(file_path, content, result)
+        return result
+    
+    def analyze_into(self, file_path: Path, content: str, result: AnalysisResult) -> None:
         rel_path = str(file_path)
         
         if file_path.suffix == ".mod":
             result.dependencies.extend(self._parse_go_mod(content, rel_path))
-            return result
+            return
         
-        # Extract structs
-        for match in self.STRUCT_PATTERN.finditer(content):
-            struct_name = match.group(1)
-            body = match.group(2)
-            
-            fields = self._parse_struct_fields(body)
-            
-            # Check if it's a model (has db/gorm tags)
-            is_model = any(
-                'gorm:' in f.get('tags', '') or 'db:' in f.get('tags', '')
-                for f in fields
-            )
-            
-            result.schemas.append(SchemaInfo(
-                name=struct_name,
-                type="model" if is_model else "type",
-                source_file=rel_path,
-                fields=fields,
-                relationships=self._extract_relationships(fields),
-                raw_definition=match.group(0),
-            ))
+        # Struct bodies by name, for the service dependency lookup below
+        struct_bodies: dict[str, str] = {}
         
-        # Extract interfaces (for understanding contracts)
-        for match in self.INTERFACE_PATTERN.finditer(content):
-            interface_name = match.group(1)
-            body = match.group(2)
+        for match in self.TYPE_PATTERN.finditer(content):
+            type_name = match.group(1)
+            body = match.group(3)
             
-            methods = self._parse_interface_methods(body)
+            if match.group(2) == "struct":
+                struct_bodies.setdefault(type_name, body)
+                
+                fields = self._parse_struct_fields(body)
+                
+                # Check if it's a model (has db/gorm tags)
+                is_model = any(
+                    'gorm:' in f.get('tags', '') or 'db:' in f.get('tags', '')
+                    for f in fields
+                )
+                
+                result.schemas.append(SchemaInfo(
+                    name=type_name,
+                    type="model" if is_model else "type",
+                    source_file=rel_path,
+                    fields=fields,
+                    relationships=self._extract_relationships(fields),
+                    raw_definition=match.group(0),
+                ))
             
-            result.business_logic.append(BusinessLogicInfo(
-                name=interface_name,
-                type="interface",
-                source_file=rel_path,
-                description=None,
-                methods=methods,
-                dependencies=[],
-                data_accessed=[],
-            ))
+            # Interfaces (for understanding contracts)
+            else:
+                result.business_logic.append(BusinessLogicInfo(
+                    name=type_name,
+                    type="interface",
+                    source_file=rel_path,
+                    description=None,
+                    methods=self._parse_interface_methods(body),
+                    dependencies=[],
+                    data_accessed=[],
+                ))
         
         # Extract HTTP routes
         result.apis.extend(self._extract_routes(content, rel_path))
         
         # Look for service structs and their methods
         result.business_logic.extend(
-            self._extract_services(content, rel_path)
+            self._extract_services(content, rel_path, struct_bodies)
         )
-        
-        return result
     
     def _parse_struct_fields(self, body: str) -> list[dict]:
         """Parse struct field definitions."""
         fields = []
         
-        for line in body.strip().splitlines():
-            line = line.strip()
-            if not line or line.startswith("//"):
-                continue
+        # Comment, brace and embedded-type lines never match, so they are
+        # skipped inside the regex engine
+        for match in self.FIELD_PATTERN.finditer(body):
+            name, field_type, tags = match.groups()
+            tags = tags or ""
             
-            match = self.FIELD_PATTERN.match(line)
-            if match:
-                name = match.group(1)
-                field_type = match.group(2)
-                tags = match.group(3) or ""
-                
-                constraints = []
-                
+            constraints = []
+            json_name = None
+            
+            if tags:
                 # Parse common tags
                 if 'primaryKey' in tags or 'primary_key' in tags:
                     constraints.append("primary_key")
-                if 'not null' in tags.lower():
+                lowered = tags.lower()
+                if 'not null' in lowered:
                     constraints.append("not_null")
-                if 'unique' in tags.lower():
+                if 'unique' in lowered:
                     constraints.append("unique")
                 
                 # Extract JSON name
-                json_match = re.search(r'json:"([^"]+)"', tags)
-                json_name = json_match.group(1).split(',')[0] if json_match else None
-                
-                fields.append({
-                    "name": name,
-                    "type": field_type,
-                    "constraints": constraints,
-                    "tags": tags,
-                    "json_name": json_name,
-                })
+                json_match = self.JSON_TAG_PATTERN.search(tags)
+                if json_match:
+                    json_name = json_match.group(1).split(',')[0]
+            
+            fields.append({
+                "name": name,
+                "type": field_type,
+                "constraints": constraints,
+                "tags": tags,
+                "json_name": json_name,
+            })
         
         return fields
     
@@ -221,24 +242,30 @@ class GoAnalyzer(Analyzer):
         
         return routes
     
-    def _extract_services(self, content: str, file_path: str) -> list[BusinessLogicInfo]:
-        """Extract service-like structs with their methods."""
-        services = []
+    def _extract_services(
+        self,
+        content: str,
+        file_path: str,
+        struct_bodies: dict[str, str],
+    ) -> list[BusinessLogicInfo]:
+        """Extract service-like structs with their methods.
         
-        # Find structs ending in Service, Handler, Controller, etc.
-        service_pattern = re.compile(
-            r'type\s+(\w+(?:Service|Handler|Controller|Manager|Repository))\s+struct',
-            re.MULTILINE
-        )
+        *struct_bodies* maps struct names to the body of their first
+        definition in the file.
+        """
+        services = []
+        methods_by_receiver = None
         
-        for match in service_pattern.finditer(content):
+        for match in self.SERVICE_PATTERN.finditer(content):
             service_name = match.group(1)
             
-            # Find methods on this struct
-            methods = self._find_receiver_methods(content, service_name)
+            # Find methods on this struct; one scan serves every service
+            if methods_by_receiver is None:
+                methods_by_receiver = self._receiver_methods(content)
+            methods = list(methods_by_receiver.get(service_name, ()))
             
             # Find dependencies (struct fields)
-            deps = self._find_struct_deps(content, service_name)
+            deps = self._struct_deps(struct_bodies.get(service_name))
             
             if methods:
                 services.append(BusinessLogicInfo(
@@ -253,39 +280,25 @@ class GoAnalyzer(Analyzer):
         
         return services
     
-    def _find_receiver_methods(self, content: str, struct_name: str) -> list[dict]:
-        """Find methods with a receiver of the given struct type."""
-        methods = []
+    def _receiver_methods(self, content: str) -> dict[str, list[dict]]:
+        """Group the file's exported methods by receiver type."""
+        methods: dict[str, list[dict]] = {}
         
-        # Match: func (s *StructName) MethodName(params) returns
-        pattern = re.compile(
-            rf'func\s+\(\w+\s+\*?{struct_name}\)\s+(\w+)\s*\(([^)]*)\)\s*([^{{]*)',
-            re.MULTILINE
-        )
-        
-        for match in pattern.finditer(content):
-            if not match.group(1).startswith("_"):  # Skip private methods
-                methods.append({
-                    "name": match.group(1),
-                    "params": match.group(2),
-                    "returns": match.group(3).strip(),
+        for match in self.RECEIVER_METHOD_PATTERN.finditer(content):
+            if not match.group(2).startswith("_"):  # Skip private methods
+                methods.setdefault(match.group(1), []).append({
+                    "name": match.group(2),
+                    "params": match.group(3),
+                    "returns": match.group(4).strip(),
                 })
         
         return methods
     
-    def _find_struct_deps(self, content: str, struct_name: str) -> list[str]:
+    def _struct_deps(self, body: str | None) -> list[str]:
         """Find dependencies from struct fields."""
         deps = []
         
-        # Find the struct definition
-        pattern = re.compile(
-            rf'type\s+{struct_name}\s+struct\s*\{{([^}}]+)\}}',
-            re.MULTILINE | re.DOTALL
-        )
-        
-        match = pattern.search(content)
-        if match:
-            body = match.group(1)
+        if body:
             for line in body.splitlines():
                 line = line.strip()
                 if not line:
@@ -304,27 +317,21 @@ class GoAnalyzer(Analyzer):
         """Parse go.mod file for dependencies."""
         deps = []
         
+        # Only block delimiters and "module/path v1.2.3" lines match, so the
+        # loop runs per match rather than per line
         in_require = False
-        for line in content.splitlines():
-            line = line.strip()
-            
-            if line.startswith("require ("):
+        for match in self.GO_MOD_PATTERN.finditer(content):
+            if match.group("open"):
                 in_require = True
-                continue
-            elif line == ")":
+            elif match.group("close"):
                 in_require = False
-                continue
-            
-            if in_require or line.startswith("require "):
-                # Parse: module/path v1.2.3
-                match = re.match(r'(?:require\s+)?(\S+)\s+(v\S+)', line)
-                if match:
-                    deps.append(DependencyInfo(
-                        name=match.group(1),
-                        version=match.group(2),
-                        type="runtime",
-                        source_file=file_path,
-                        ecosystem="go",
-                    ))
+            elif in_require or match.group().lstrip().startswith("require "):
+                deps.append(DependencyInfo(
+                    name=match.group("name"),
+                    version=match.group("version"),
+                    type="runtime",
+                    source_file=file_path,
+                    ecosystem="go",
+                ))
         
         return deps
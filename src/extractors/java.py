@@ -62,7 +62,10 @@ class JavaAnalyzer(Analyzer):
             repo_path=str(file_path.parent),
             repo_name=file_path.parent.name,
         )
-        
+        self.analyze_into(file_path, content, result)
+        return result
+    
+    def analyze_into(self, file_path: Path, content: str, result: AnalysisResult) -> None:
         rel_path = str(file_path)
         
         # Extract entities/models
@@ -100,8 +103,6 @@ class JavaAnalyzer(Analyzer):
         # Check for pom.xml style dependencies
         if file_path.name == "pom.xml":
             result.dependencies.extend(self._parse_pom(content, rel_path))
-        
-        return result
     
     def _extract_fields(self, content: str, class_start: int) -> list[dict]:
         """Extract field definitions from a class."""
@@ -20,6 +20,10 @@ class JavaScriptAnalyzer(Analyzer):
     extensions = [".js", ".ts", ".jsx", ".tsx", ".mjs", ".cjs"]
     language = "javascript"
     
+    # Sources past this size are almost always bundled, minified or generated
+    # (search indexes, vendored libraries): slow to scan, nothing to find
+    max_file_size = 256 * 1024
+    
     # TypeScript interface/type patterns
     INTERFACE_PATTERN = re.compile(
         r'(?:export\s+)?interface\s+(\w+)(?:<[^>]+>)?\s*(?:extends\s+[^{]+)?\s*\{([^}]+)\}',
@@ -65,18 +69,21 @@ class JavaScriptAnalyzer(Analyzer):
             repo_path=str(file_path.parent),
             repo_name=file_path.parent.name,
         )
-        
+        self.analyze_into(file_path, content, result)
+        return result
+    
+    def analyze_into(self, file_path: Path, content: str, result: AnalysisResult) -> None:
         rel_path = str(file_path)
         
         # Handle package.json
         if file_path.name == "package.json":
             result.dependencies.extend(self._parse_package_json(content, rel_path))
-            return result
+            return
         
         # Handle Prisma schema
         if file_path.suffix == ".prisma":
             result.schemas.extend(self._parse_prisma_schema(content, rel_path))
-            return result
+            return
         
         # Extract TypeScript interfaces
         for match in self.INTERFACE_PATTERN.finditer(content):
@@ -147,8 +154,6 @@ class JavaScriptAnalyzer(Analyzer):
         result.business_logic.extend(
             self._extract_services(content, rel_path)
         )
-        
-        return result
     
     def _parse_ts_fields(self, body: str) -> list[dict]:
         """Parse TypeScript interface/type fields."""
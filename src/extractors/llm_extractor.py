@@ -2,6 +2,7 @@
 
 import hashlib
 import json
+import os
 import re
 import time
 from dataclasses import dataclass
@@ -859,26 +860,27 @@ class LLMAnalyzer:
     
     def find_files(self, repo_path: Path) -> Iterator[Path]:
         """Find relevant files in repository."""
-        for file_path in repo_path.rglob("*"):
-            # Skip directories in exclusion list
-            if any(skip in file_path.parts for skip in self.skip_dirs):
-                continue
+        for dirpath, dirnames, filenames in os.walk(repo_path):
+            # Prune excluded directories instead of filtering every descendant
+            dirnames[:] = [d for d in dirnames if d not in self.skip_dirs]
             
-            if not file_path.is_file():
-                continue
-            
-            # Check extension
-            if file_path.suffix.lower() not in self.include_extensions:
-                continue
-            
-            # Check file size
-            try:
-                if file_path.stat().st_size > self.max_file_size:
+            for name in filenames:
+                # Check extension
+                if os.path.splitext(name)[1].lower() not in self.include_extensions:
                     continue
-            except OSError:
-                continue
-            
-            yield file_path
+                
+                file_path = Path(dirpath, name)
+                if not file_path.is_file():
+                    continue
+                
+                # Check file size
+                try:
+                    if file_path.stat().st_size > self.max_file_size:
+                        continue
+                except OSError:
+                    continue
+                
+                yield file_path
     
     def analyze_repository(self, repo_path: Path) -> AnalysisResult:
         """Analyze a repository using holistic LLM context generation."""
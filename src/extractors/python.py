@@ -39,14 +39,17 @@ class PythonAnalyzer(Analyzer):
             repo_path=str(file_path.parent),
             repo_name=file_path.parent.name,
         )
-        
+        self.analyze_into(file_path, content, result)
+        return result
+    
+    def analyze_into(self, file_path: Path, content: str, result: AnalysisResult) -> None:
         rel_path = str(file_path)
         
         try:
             tree = ast.parse(content)
         except SyntaxError as e:
             result.errors.append(f"Syntax error in {file_path}: {e}")
-            return result
+            return
         
         # Analyze classes
         for node in ast.walk(tree):
@@ -61,8 +64,6 @@ class PythonAnalyzer(Analyzer):
             result.dependencies.extend(
                 self._parse_dependencies(content, file_path.name, rel_path)
             )
-        
-        return result
     
     def _analyze_class(
         self,
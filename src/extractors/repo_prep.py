@@ -176,13 +176,14 @@ class RepoFilePreparator:
         tier2_paths: list[Path] = []
         tier3_paths: list[Path] = []
 
-        for file_path in sorted(repo_path.rglob("*")):
-            if not file_path.is_file():
-                continue
+        candidates: list[Path] = []
+        for dirpath, dirnames, filenames in os.walk(repo_path):
+            # Prune excluded directories so their subtrees are never listed
+            dirnames[:] = [d for d in dirnames if d not in self.skip_dirs]
+            candidates.extend(Path(dirpath, name) for name in filenames)
 
-            # Skip excluded directories
-            rel_parts = file_path.relative_to(repo_path).parts
-            if any(part in self.skip_dirs for part in rel_parts):
+        for file_path in sorted(candidates):
+            if not file_path.is_file():
                 continue
 
             # Skip files larger than threshold
@@ -21,7 +21,10 @@ class SchemaAnalyzer(Analyzer):
             repo_path=str(file_path.parent),
             repo_name=file_path.parent.name,
         )
-        
+        self.analyze_into(file_path, content, result)
+        return result
+    
+    def analyze_into(self, file_path: Path, content: str, result: AnalysisResult) -> None:
         rel_path = str(file_path)
         
         if file_path.suffix == ".sql":
@@ -30,8 +33,6 @@ class SchemaAnalyzer(Analyzer):
             result.schemas.extend(self._parse_graphql(content, rel_path))
         elif file_path.suffix == ".proto":
             result.schemas.extend(self._parse_protobuf(content, rel_path))
-        
-        return result
     
     def _parse_sql(self, content: str, file_path: str) -> list[SchemaInfo]:
         """Parse SQL CREATE TABLE statements."""
@@ -10,6 +10,7 @@ from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from .crawler.models import RepoInfo
+from .crawler.filters import compile_exclusions
 from .crawler.gitlab_client import GitLabClient
 from .crawler.github_client import GitHubClient
 from .crawler.repo_manager import RepoManager
@@ -52,15 +53,12 @@ def discover_local_repos(config: dict) -> list[Path]:
        included.  This covers monorepo layouts and plain code directories that
        were never ``git init``-ed.
     """
-    import re
-
     local_config = config["local"]
     raw_paths = local_config["repos_path"]
     if isinstance(raw_paths, str):
         raw_paths = [raw_paths]
 
-    exclude_patterns = local_config.get("exclude_patterns") or []
-    compiled = [re.compile(p) for p in exclude_patterns]
+    exclude = compile_exclusions(local_config.get("exclude_patterns"))
 
     found: list[Path] = []
 
@@ -79,7 +77,7 @@ def discover_local_repos(config: dict) -> list[Path]:
         for entry in sorted(repos_path.iterdir()):
             if not entry.is_dir():
                 continue
-            if any(p.search(entry.name) for p in compiled):
+            if exclude and exclude.search(entry.name):
                 continue
             # Accept git repos or any non-empty directory (plain code folders)
             if (entry / ".git").exists():
@@ -127,6 +125,7 @@ def run_crawl(config: dict) -> list[RepoInfo]:
             token=gh_config.get("token", ""),
             orgs=gh_config.get("orgs"),
             exclude_patterns=gh_config.get("exclude_patterns"),
+            concurrency=gh_config.get("discover_concurrency", 8),
         )
     else:
         gl_config = config["gitlab"]
@@ -172,7 +171,9 @@ def run_analyze(config: dict, repo_paths: list[Path], use_llm: bool = False) ->
     # Always run pattern-based extraction first for schemas, APIs, services, deps
     console.print("[blue]Running pattern-based extraction[/blue]")
 
-    registry = create_default_registry()
+    registry = create_default_registry(
+        result_cache_bytes=analysis_config.get("result_cache_bytes", 0),
+    )
 
     with Progress(
         SpinnerColumn(),
@@ -189,6 +190,7 @@ def run_analyze(config: dict, repo_paths: list[Path], use_llm: bool = False) ->
                 skip_dirs=analysis_config.get("skip_dirs"),
                 include_extensions=analysis_config.get("include_extensions"),
                 max_file_size=analysis_config.get("max_file_size", 1_048_576),
+                workers=analysis_config.get("workers", 1),
             )
 
             kb.add_result(result)
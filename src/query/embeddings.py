@@ -1,8 +1,13 @@
 """Semantic search with embeddings."""
 
 import json
+import queue
+import threading
+import weakref
+from concurrent.futures import Future
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 from rich.console import Console
 
@@ -12,6 +17,15 @@ console = Console()
 _sentence_transformer = None
 _chromadb = None
 
+# Documents embedded per model call when indexing reports progress
+INDEX_BATCH_SIZE = 64
+
+# Distinct query strings whose embeddings each SemanticSearch keeps
+EMBEDDING_CACHE_SIZE = 4096
+
+# Chunks read per request when listing the repos in the collection
+REPO_SCAN_PAGE_SIZE = 10_000
+
 
 def _get_sentence_transformer():
     """Lazy load sentence-transformers."""
@@ -43,6 +57,78 @@ def _get_chromadb():
     return _chromadb
 
 
+# Queued by a _MicroBatcher's finalizer to stop its worker thread
+_STOP = object()
+
+
+class _MicroBatcher:
+    """Coalesce concurrent single-item calls into batched calls.
+
+    Callers block on a future while one background thread runs ``run`` on
+    a list of items, which must return one result per item; an exception
+    instance in place of a result is raised to that item's caller only,
+    while an exception raised by ``run`` fails the whole batch. Items that
+    arrive while a batch is running are picked up together as the next
+    batch, so a lone request never waits for company but concurrent ones
+    share a model call or vector-store query.
+
+    ``run`` must be a bound method. The worker thread only holds it weakly
+    and exits once its owner is garbage collected, so a batcher never keeps
+    its owner (and e.g. a loaded model) alive.
+    """
+
+    def __init__(self, run: Callable[[list], Any], max_batch: int = 64, name: str = "micro-batcher"):
+        self._run_batch = weakref.WeakMethod(run)
+        self._max_batch = max_batch
+        self._name = name
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        weakref.finalize(run.__self__, self._queue.put, _STOP)
+
+    def submit(self, item):
+        """Process *item*, sharing the batched call with concurrent callers."""
+        future: Future = Future()
+        self._queue.put((item, future))
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+                    self._thread.start()
+        return future.result()
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            batch = [self._queue.get()]
+            while len(batch) < self._max_batch:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            stopping = _STOP in batch
+            batch = [entry for entry in batch if entry is not _STOP]
+            if batch:
+                self._process(batch)
+
+    def _process(self, batch: list) -> None:
+        # The owner is only held strongly for the duration of one batch
+        run = self._run_batch()
+        try:
+            if run is None:
+                raise RuntimeError(f"{self._name} owner was garbage collected")
+            results = run([item for item, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+        for (_, future), result in zip(batch, results):
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
 class SemanticSearch:
     """Semantic search engine using embeddings."""
     
@@ -56,6 +142,16 @@ class SemanticSearch:
         self._model = None
         self._client = None
         self._collection = None
+        self._repos: list[str] | None = None
+        self._embed_batcher = _MicroBatcher(self._encode_many, name="embedding-batcher")
+        self._query_batcher = _MicroBatcher(self._query_many, name="query-batcher")
+        # The cache holds the method weakly: a bound method stored on self
+        # would make a cycle, keeping discarded instances (and their model)
+        # alive until a full collection, or forever once gc.freeze()d
+        embed_normalized = weakref.WeakMethod(self._embed_normalized)
+        self._embed_cached = lru_cache(maxsize=EMBEDDING_CACHE_SIZE)(
+            lambda text: embed_normalized()(text)
+        )
     
     @property
     def model(self):
@@ -85,8 +181,16 @@ class SemanticSearch:
             )
         return self._collection
     
-    def index_chunks(self, chunks_path: Path | str) -> int:
-        """Index chunks from JSON file into vector store."""
+    def index_chunks(
+        self,
+        chunks_path: Path | str,
+        progress: Callable[[int, int], None] | None = None,
+    ) -> int:
+        """Index chunks from JSON file into vector store.
+
+        If given, *progress* is called with (embedded, total) chunk counts
+        after each batch of ``INDEX_BATCH_SIZE`` chunks is embedded.
+        """
         chunks_path = Path(chunks_path)
         
         if not chunks_path.exists():
@@ -126,7 +230,13 @@ class SemanticSearch:
         
         # Generate embeddings
         console.print("[blue]Generating embeddings...[/blue]")
-        embeddings = self.model.encode(documents, show_progress_bar=True).tolist()
+        if progress is None:
+            embeddings = self.model.encode(documents, show_progress_bar=True).tolist()
+        else:
+            embeddings = []
+            for i in range(0, len(documents), INDEX_BATCH_SIZE):
+                embeddings.extend(self.model.encode(documents[i:i + INDEX_BATCH_SIZE]).tolist())
+                progress(len(embeddings), len(documents))
         
         # Upsert to ChromaDB (handles duplicates)
         batch_size = 500
@@ -139,15 +249,40 @@ class SemanticSearch:
                 metadatas=metadatas[i:end],
             )
         
+        self._repos = None
         console.print(f"[green]✓[/green] Indexed {len(ids)} chunks")
         return len(ids)
     
+    def embed(self, text: str):
+        """Embed a single query string as a read-only unit vector.
+
+        Embeddings of recent queries are cached, so a question sent to both
+        semantic search and ask is embedded once. Concurrent calls from
+        request threads are batched into one model call.
+        """
+        return self._embed_cached(text)
+    
+    def _encode_many(self, texts: list[str]):
+        return self.model.encode(texts)
+    
+    def _embed_normalized(self, text: str):
+        import numpy as np
+
+        vector = np.asarray(self._embed_batcher.submit(text), dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        if norm:
+            vector = vector / norm
+        # Shared by every caller of the cache
+        vector.setflags(write=False)
+        return vector
+    
     def search(
         self,
         query: str,
         limit: int = 10,
         type_filter: str | None = None,
         repo_filter: str | None = None,
+        query_embedding=None,
     ) -> list[dict]:
         """
         Semantic search across the knowledge base.
@@ -157,6 +292,7 @@ class SemanticSearch:
             limit: Maximum results to return
             type_filter: Filter by type (schema, service, api)
             repo_filter: Filter by repository name
+            query_embedding: Precomputed embedding of the query, if any
         
         Returns:
             List of results with scores and metadata
@@ -168,7 +304,13 @@ class SemanticSearch:
         if type_filter:
             where_conditions.append({"type": type_filter})
         if repo_filter:
-            where_conditions.append({"repo": {"$contains": repo_filter}})
+            # Metadata filters have no substring operator: resolve the
+            # substring to the matching repo names so the vector store
+            # applies it while searching
+            repos = [repo for repo in self._repo_names() if repo_filter in repo]
+            if not repos:
+                return []
+            where_conditions.append({"repo": {"$in": repos}})
         
         if len(where_conditions) == 1:
             where = where_conditions[0]
@@ -176,15 +318,11 @@ class SemanticSearch:
             where = {"$and": where_conditions}
         
         # Generate query embedding
-        query_embedding = self.model.encode([query])[0].tolist()
+        if query_embedding is None:
+            query_embedding = self.embed(query)
         
-        # Search
-        results = self.collection.query(
-            query_embeddings=[query_embedding],
-            n_results=limit,
-            where=where,
-            include=["documents", "metadatas", "distances"],
-        )
+        # Search, in one collection query with concurrent searches
+        results = self._query_batcher.submit((list(map(float, query_embedding)), where, limit))
         
         # Format results
         formatted = []
@@ -204,6 +342,55 @@ class SemanticSearch:
         
         return formatted
     
+    def _repo_names(self) -> list[str]:
+        """Distinct repo names in the collection, read once and kept until reindexing."""
+        if self._repos is None:
+            repos = set()
+            offset = 0
+            while True:
+                page = self.collection.get(include=["metadatas"], limit=REPO_SCAN_PAGE_SIZE, offset=offset)
+                metadatas = page.get("metadatas") or []
+                repos.update(m.get("repo", "") for m in metadatas if m)
+                if len(metadatas) < REPO_SCAN_PAGE_SIZE:
+                    break
+                offset += REPO_SCAN_PAGE_SIZE
+            self._repos = sorted(repos)
+        return self._repos
+
+    def _query_many(self, requests: list[tuple[list[float], dict | None, int]]) -> list[dict | Exception]:
+        """Run (embedding, where, limit) queries, one collection query per filter.
+
+        Each result has the shape of a single-embedding ``collection.query``
+        result. Queries sharing a filter are sent together with the largest
+        limit, and each one's hits are cut back to its own limit. If the
+        query for a filter fails, its requests get the exception instead.
+        """
+        groups: dict[str, list[int]] = {}
+        for i, (_, where, _) in enumerate(requests):
+            groups.setdefault(json.dumps(where, sort_keys=True), []).append(i)
+
+        answers: list[dict | Exception] = [{} for _ in requests]
+        for members in groups.values():
+            try:
+                results = self.collection.query(
+                    query_embeddings=[requests[i][0] for i in members],
+                    n_results=max(requests[i][2] for i in members),
+                    where=requests[members[0]][1],
+                    include=["documents", "metadatas", "distances"],
+                )
+            except Exception as e:
+                for i in members:
+                    answers[i] = e
+                continue
+            for j, i in enumerate(members):
+                limit = requests[i][2]
+                answers[i] = {
+                    key: [values[j][:limit]] if values else values
+                    for key, values in results.items()
+                    if key in ("ids", "documents", "metadatas", "distances")
+                }
+        return answers
+
     def search_similar(self, chunk_id: str, limit: int = 5) -> list[dict]:
         """Find chunks similar to a given chunk."""
         # Get the chunk's embedding
@@ -247,12 +434,12 @@ class SemanticSearch:
         
         return formatted
     
-    def ask(self, question: str, limit: int = 5) -> dict:
+    def ask(self, question: str, limit: int = 5, query_embedding=None) -> dict:
         """
         Answer a question using the knowledge base.
         Returns relevant context for RAG.
         """
-        results = self.search(question, limit=limit)
+        results = self.search(question, limit=limit, query_embedding=query_embedding)
         
         # Build context from results
         context_parts = []
@@ -0,0 +1,397 @@
+"""In-memory indexes over a loaded knowledge base."""
+
+from bisect import bisect_right
+from collections import Counter, defaultdict
+from typing import Any, Callable, Iterator
+
+
+# Joins a column's values into one searchable string; never part of a needle
+_SEP = "\0"
+
+
+class _Collection:
+    """One knowledge-base list with filter columns computed up front.
+
+    ``folded`` maps a field to the function that normalizes it (``str.lower``
+    for case-insensitive substring filters, ``str.upper`` for HTTP methods);
+    the normalized values are stored as a column parallel to ``rows``.
+    ``substring`` fields, among the folded ones, are also indexed for
+    substring filters: by trigram, so a needle of three or more characters
+    only visits values sharing its rarest trigram, and as one joined string
+    that shorter needles are found in with ``str.find``.
+    ``indexed`` fields get an inverted index from exact value to row numbers,
+    keyed by the normalized value when the field is also folded.
+    """
+
+    def __init__(
+        self,
+        rows: list[dict],
+        folded: dict[str, Callable[[str], str]] | None = None,
+        substring: tuple[str, ...] = (),
+        indexed: tuple[str, ...] = (),
+    ):
+        self.rows = rows
+        self.columns: dict[str, list[str]] = {
+            name: [fold(row.get(name) or "") for row in rows]
+            for name, fold in (folded or {}).items()
+        }
+        # Per column: (joined values, offset of each row's value plus a final end offset)
+        self.joined: dict[str, tuple[str, list[int]]] = {}
+        # Per column: distinct values, the rows holding each, and trigram -> value numbers
+        self.trigrams: dict[str, tuple[list[str], list[list[int]], dict[str, list[int]]]] = {}
+        for name in substring:
+            column = self.columns[name]
+            self.trigrams[name] = _trigram_index(column)
+            starts = []
+            offset = 0
+            for value in column:
+                starts.append(offset)
+                offset += len(value) + 1
+            starts.append(offset)
+            self.joined[name] = (_SEP.join(column) + _SEP, starts)
+        self.index: dict[str, dict[Any, list[int]]] = {}
+        for name in indexed:
+            values = self.columns[name] if name in self.columns else [row.get(name) for row in rows]
+            postings: dict[Any, list[int]] = {}
+            for i, value in enumerate(values):
+                postings.setdefault(value, []).append(i)
+            self.index[name] = postings
+
+    def filter(
+        self,
+        contains: dict[str, str] | None = None,
+        equals: dict[str, str] | None = None,
+        exact: dict[str, Any] | None = None,
+    ) -> Iterator[dict]:
+        """Yield rows matching every given filter, in original order.
+
+        ``contains`` and ``equals`` compare already-normalized needles with
+        the folded columns; ``exact`` values are looked up in the inverted
+        indexes. Empty needles are ignored, like the API's optional filters.
+        Rows are tested lazily, so a caller that stops after ``limit``
+        results does not pay for the rest of the collection.
+        """
+        candidates: list[int] | None = None
+        for name, value in (exact or {}).items():
+            if value:
+                postings = self.index[name].get(value, [])
+                candidates = postings if candidates is None else _intersect(candidates, postings)
+
+        checks = []
+        for name, needle in (contains or {}).items():
+            if not needle:
+                continue
+            matches = self._containing(name, needle, candidates)
+            if matches is None:
+                checks.append((self.columns[name], needle, True))
+            else:
+                candidates = matches if candidates is None else _intersect(candidates, matches)
+        checks += [(self.columns[name], needle, False) for name, needle in (equals or {}).items() if needle]
+        # Most selective first, so the row test usually fails on its first check:
+        # equality before substring, longer needles before shorter ones
+        checks.sort(key=lambda check: (check[2], -len(check[1])))
+
+        if candidates is None:
+            candidates = range(len(self.rows))
+        rows = self.rows
+        if not checks:
+            return (rows[i] for i in candidates)
+        if len(checks) == 1:
+            column, needle, substring = checks[0]
+            if substring:
+                return (rows[i] for i in candidates if needle in column[i])
+            return (rows[i] for i in candidates if column[i] == needle)
+        return (
+            rows[i] for i in candidates
+            if all((needle in column[i]) if substring else (column[i] == needle) for column, needle, substring in checks)
+        )
+
+    def containing_any(self, name: str, needles: list[str]) -> list[int]:
+        """Row numbers whose *name* value contains at least one of *needles*, in order."""
+        rows: set[int] = set()
+        for needle in needles:
+            matches = self._containing(name, needle, None)
+            if matches is None:
+                column = self.columns[name]
+                matches = [i for i, value in enumerate(column) if needle in value]
+            rows.update(matches)
+        return sorted(rows)
+
+    def _containing(self, name: str, needle: str, candidates: list[int] | None) -> list[int] | None:
+        """Row numbers whose *name* value contains *needle*, in order.
+
+        Returns None when testing the rows one by one is cheaper: each hit
+        in the joined column costs a Python iteration, so the scan only pays
+        off for needles that match a small share of the remaining rows. The
+        share is checked as the scan goes, so a dense needle gives up after
+        a few dozen hits and lazy row tests can stop at the caller's limit.
+        """
+        if _SEP in needle:
+            return None
+        total = len(self.rows)
+        remaining = total if candidates is None else len(candidates)
+        if len(needle) >= 3:
+            return self._containing_by_trigram(name, needle, remaining)
+        joined, starts = self.joined[name]
+        matches = []
+        pos = joined.find(needle)
+        while pos != -1:
+            row = bisect_right(starts, pos) - 1
+            if len(matches) >= 32 and len(matches) * 8 * total > (row + 1) * remaining:
+                return None
+            matches.append(row)
+            # Resume at the next row so each row is reported once
+            pos = joined.find(needle, starts[row + 1])
+        return matches
+
+    def _containing_by_trigram(self, name: str, needle: str, remaining: int) -> list[int] | None:
+        """``_containing`` for needles of at least three characters."""
+        values, value_rows, trigrams = self.trigrams[name]
+        postings = []
+        for gram in {needle[j:j + 3] for j in range(len(needle) - 2)}:
+            posting = trigrams.get(gram)
+            if posting is None:
+                return []
+            postings.append(posting)
+        rarest = min(postings, key=len)
+        if len(rarest) * 8 > remaining:
+            # Even the rarest trigram is common: testing rows lazily is cheaper
+            return None
+        matched = [value_rows[v] for v in rarest if needle in values[v]]
+        if len(matched) == 1:
+            return matched[0]
+        return sorted(row for rows in matched for row in rows)
+
+
+def _trigram_index(column: list[str]) -> tuple[list[str], list[list[int]], dict[str, list[int]]]:
+    """Index a column's distinct values by the trigrams they contain."""
+    rows_by_value: dict[str, list[int]] = {}
+    for i, value in enumerate(column):
+        rows_by_value.setdefault(value, []).append(i)
+    values = list(rows_by_value)
+    trigrams: dict[str, list[int]] = {}
+    for v, value in enumerate(values):
+        for gram in {value[j:j + 3] for j in range(len(value) - 2)}:
+            trigrams.setdefault(gram, []).append(v)
+    return values, list(rows_by_value.values()), trigrams
+
+
+def _intersect(rows: list[int], other: list[int]) -> list[int]:
+    """Rows present in both lists, in the order of *rows*."""
+    allowed = set(other)
+    return [i for i in rows if i in allowed]
+
+
+def _repo_stats(data: dict) -> list[dict[str, Any]]:
+    """Per-repository counts, languages and context flags, sorted by name."""
+    counts = {
+        kind: Counter(row.get("repo", "unknown") for row in data.get(kind, []))
+        for kind in ("schemas", "apis", "services")
+    }
+
+    # Dependencies per repo, and per repo and ecosystem as a language hint
+    dependencies: Counter = Counter()
+    ecosystems: dict[str, Counter] = defaultdict(Counter)
+    for dep in data.get("dependencies", []):
+        repo = dep.get("repo", "unknown")
+        dependencies[repo] += 1
+        ecosystem = dep.get("ecosystem", "")
+        if ecosystem:
+            ecosystems[repo][ecosystem] += 1
+
+    # Repository metadata languages replace the dependency-based guess
+    languages: dict[str, dict] = {repo: dict(counter) for repo, counter in ecosystems.items()}
+    named: set[str] = set()
+    for repo_info in data.get("repositories", []):
+        name = repo_info.get("name", "")
+        if name:
+            named.add(name)
+            if repo_info.get("languages"):
+                languages[name] = repo_info["languages"]
+
+    purposes: dict[str, str] = {}
+    for ctx in data.get("contexts", []):
+        repo_name = ctx.get("repo_name", "")
+        if repo_name:
+            purposes[repo_name] = ctx.get("purpose", "")
+
+    names = set(dependencies).union(named, purposes, *counts.values())
+    schemas, apis, services = counts["schemas"], counts["apis"], counts["services"]
+    return [
+        {
+            "name": name,
+            "schemas": schemas[name],
+            "apis": apis[name],
+            "services": services[name],
+            "dependencies": dependencies[name],
+            "languages": languages.get(name, {}),
+            "has_context": name in purposes,
+            "purpose": purposes.get(name, ""),
+        }
+        for name in sorted(names)
+    ]
+
+
+class KBIndex:
+    """Filter indexes for the knowledge-base list endpoints.
+
+    Built once per knowledge-base load so requests compare against
+    pre-normalized strings instead of lowercasing every row on every call.
+    """
+
+    def __init__(self, data: dict):
+        self.schemas = _Collection(
+            data.get("schemas", []),
+            folded={"name": str.lower, "repo": str.lower},
+            substring=("name", "repo"),
+            indexed=("type",),
+        )
+        self.services = _Collection(
+            data.get("services", []),
+            folded={"name": str.lower, "repo": str.lower},
+            substring=("name", "repo"),
+        )
+        self.apis = _Collection(
+            data.get("apis", []),
+            folded={"path": str.lower, "method": str.upper, "repo": str.lower},
+            substring=("path", "repo"),
+            indexed=("method",),
+        )
+        dependencies = data.get("dependencies", [])
+        self.dependencies = _Collection(
+            dependencies,
+            folded={"name": str.lower},
+            substring=("name",),
+            indexed=("ecosystem",),
+        )
+        # Deduplicated by name, keeping the first occurrence: across all
+        # ecosystems, and separately within each ecosystem.
+        first_by_name: dict[str, dict] = {}
+        first_by_ecosystem_name: dict[tuple[Any, str], dict] = {}
+        for dep in dependencies:
+            name = dep.get("name", "")
+            first_by_name.setdefault(name, dep)
+            first_by_ecosystem_name.setdefault((dep.get("ecosystem"), name), dep)
+        self.unique_dependencies = _Collection(
+            list(first_by_name.values()),
+            folded={"name": str.lower},
+            substring=("name",),
+        )
+        self.unique_dependencies_by_ecosystem = _Collection(
+            list(first_by_ecosystem_name.values()),
+            folded={"name": str.lower},
+            substring=("name",),
+            indexed=("ecosystem",),
+        )
+        # Business glossary entries of every semantic layer, each tagged with its repo
+        self.glossary: list[dict] = [
+            {**entry, "repo": layer.get("repo_name", "")}
+            for layer in data.get("semantic_layers", [])
+            for entry in layer.get("business_glossary", [])
+        ]
+        # Query recipes of every semantic layer, each tagged with its repo
+        self.recipes = _Collection(
+            [
+                {**recipe, "repo": layer.get("repo_name", "")}
+                for layer in data.get("semantic_layers", [])
+                for recipe in layer.get("query_recipes", [])
+            ],
+            folded={"question": str.lower, "repo": str.lower},
+            substring=("question", "repo"),
+        )
+        # First context and semantic layer per lowercased repo name
+        self.contexts_by_repo: dict[str, dict] = {}
+        for context in data.get("contexts", []):
+            self.contexts_by_repo.setdefault((context.get("repo_name") or "").lower(), context)
+        self.semantic_layers_by_repo: dict[str, dict] = {}
+        for layer in data.get("semantic_layers", []):
+            self.semantic_layers_by_repo.setdefault((layer.get("repo_name") or "").lower(), layer)
+        self.repo_stats = _repo_stats(data)
+
+        # Reverse edges: who references a schema, and which services depend
+        # on a name, keyed by the lowercased target.
+        self.schema_referrers: dict[str, list[dict]] = {}
+        for schema in self.schemas.rows:
+            for rel in schema.get("relationships", []):
+                self.schema_referrers.setdefault((rel.get("target") or "").lower(), []).append({
+                    "source": schema.get("name"),
+                    "type": rel.get("type"),
+                    "via": rel.get("field"),
+                })
+        self.service_dependents: dict[str, list[str]] = {}
+        for service in self.services.rows:
+            for dep in {d.lower() for d in service.get("dependencies", [])}:
+                self.service_dependents.setdefault(dep, []).append(service.get("name"))
+
+    def find_schemas(self, name: str | None = None, type: str | None = None, repo: str | None = None) -> Iterator[dict]:
+        """Schemas whose name/repo contain the given text and with the given type."""
+        return self.schemas.filter(
+            contains={"name": (name or "").lower(), "repo": (repo or "").lower()},
+            exact={"type": type},
+        )
+
+    def find_services(self, name: str | None = None, repo: str | None = None) -> Iterator[dict]:
+        """Services whose name/repo contain the given text."""
+        return self.services.filter(
+            contains={"name": (name or "").lower(), "repo": (repo or "").lower()},
+        )
+
+    def find_apis(self, path: str | None = None, method: str | None = None, repo: str | None = None) -> Iterator[dict]:
+        """APIs whose path/repo contain the given text, with the given HTTP method."""
+        return self.apis.filter(
+            contains={"path": (path or "").lower(), "repo": (repo or "").lower()},
+            exact={"method": (method or "").upper()},
+        )
+
+    def find_dependencies(self, name: str | None = None, ecosystem: str | None = None) -> Iterator[dict]:
+        """Dependencies whose name contains the given text, in the given ecosystem."""
+        return self.dependencies.filter(
+            contains={"name": (name or "").lower()},
+            exact={"ecosystem": ecosystem},
+        )
+
+    def find_unique_dependencies(self, name: str | None = None, ecosystem: str | None = None) -> Iterator[dict]:
+        """Like ``find_dependencies``, keeping only the first match per name."""
+        needle = {"name": (name or "").lower()}
+        if ecosystem:
+            return self.unique_dependencies_by_ecosystem.filter(contains=needle, exact={"ecosystem": ecosystem})
+        return self.unique_dependencies.filter(contains=needle)
+
+    def find_recipes(self, question: str | None = None, repo: str | None = None) -> Iterator[dict]:
+        """Query recipes whose question/repo contain the given text."""
+        return self.recipes.filter(
+            contains={"question": (question or "").lower(), "repo": (repo or "").lower()},
+        )
+
+    def matching_recipes(self, question: str, limit: int = 3) -> list[dict]:
+        """Query recipes whose question contains any word of *question* longer than three letters."""
+        terms = [term for term in question.lower().split() if len(term) > 3]
+        rows = self.recipes.rows
+        return [rows[i] for i in self.recipes.containing_any("question", terms)[:limit]]
+
+    def schema_relationships(self, name: str) -> dict:
+        """Relationships of the schemas matching *name*, as ``SearchEngine`` reports them."""
+        schemas = list(self.find_schemas(name=name))
+        if not schemas:
+            return {"references_to": [], "referenced_by": []}
+        target = (schemas[0].get("name") or "").lower()
+        return {
+            "references_to": [
+                {"target": rel.get("target"), "type": rel.get("type"), "via": rel.get("field")}
+                for schema in schemas
+                for rel in schema.get("relationships", [])
+            ],
+            "referenced_by": list(self.schema_referrers.get(target, [])),
+        }
+
+    def service_dependencies(self, name: str) -> dict:
+        """Dependency graph of the services matching *name*, as ``SearchEngine`` reports it."""
+        services = list(self.find_services(name=name))
+        if not services:
+            return {"depends_on": [], "depended_by": []}
+        target = (services[0].get("name") or "").lower()
+        return {
+            # The last match wins, as in SearchEngine.get_service_dependencies
+            "depends_on": services[-1].get("dependencies", []),
+            "depended_by": list(self.service_dependents.get(target, [])),
+        }
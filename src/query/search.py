@@ -1,6 +1,10 @@
 """Search engine for querying the knowledge base."""
 
 import json
+import mmap
+import os
+import pickle
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -9,6 +13,57 @@ from rich.table import Table
 
 console = Console()
 
+# Distinct queries whose ranked results each engine keeps in memory
+SEARCH_CACHE_SIZE = 2048
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson ships with the api extra
+    orjson = None
+
+
+def _parse_json_file(path: Path) -> Any:
+    """Parse a JSON file, with orjson over a memory map when available."""
+    if orjson is None:
+        return json.loads(path.read_bytes())
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return orjson.loads(b"")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return orjson.loads(memoryview(mm))
+
+
+def _load_kb_cached(kb_path: Path) -> dict:
+    """Load the knowledge base, reusing a pickled copy when it is current.
+
+    The pickle is written next to the JSON file and tagged with the JSON's
+    mtime and size, so it is rebuilt whenever the knowledge base changes.
+    """
+    st = kb_path.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    cache_path = kb_path.with_name(kb_path.name + ".pkl")
+    
+    try:
+        with open(cache_path, "rb") as f:
+            cached_stamp, data = pickle.load(f)
+        if cached_stamp == stamp:
+            return data
+    except (OSError, EOFError, pickle.UnpicklingError, ValueError, TypeError):
+        pass
+    
+    data = _parse_json_file(kb_path)
+    
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            pickle.dump((stamp, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # A read-only output directory just means no cache
+        tmp_path.unlink(missing_ok=True)
+    
+    return data
+
 
 class SearchEngine:
     """Search and query the knowledge base."""
@@ -17,11 +72,15 @@ class SearchEngine:
         self.kb_path = Path(kb_path)
         self.data: dict = {}
         self._load()
+        # The data never changes after loading, so results for repeated
+        # queries are cached per engine (a reload builds a new engine).
+        self._ranked = lru_cache(maxsize=SEARCH_CACHE_SIZE)(self._rank)
+        self._matches = lru_cache(maxsize=SEARCH_CACHE_SIZE)(self._find_by_name)
     
     def _load(self) -> None:
         """Load knowledge base from disk."""
         if self.kb_path.exists():
-            self.data = json.loads(self.kb_path.read_text())
+            self.data = _load_kb_cached(self.kb_path)
         else:
             console.print(f"[yellow]Warning:[/yellow] Knowledge base not found at {self.kb_path}")
     
@@ -30,7 +89,10 @@ class SearchEngine:
         Search across all knowledge types.
         Returns results ranked by relevance.
         """
-        query_lower = query.lower()
+        return list(self._ranked(query.lower())[:limit])
+    
+    def _rank(self, query_lower: str) -> tuple[dict, ...]:
+        """Score every item against a lowercased query, best first."""
         results = []
         
         # Search schemas
@@ -110,9 +172,9 @@ class SearchEngine:
                         "data": {**recipe, "repo": sl.get("repo_name", "")},
                     })
 
-        # Sort by score and limit
+        # Sort by score
         results.sort(key=lambda x: x["score"], reverse=True)
-        return results[:limit]
+        return tuple(results)
     
     def _score_match(self, query: str, texts: list[str]) -> float:
         """Score how well texts match the query."""
@@ -138,13 +200,16 @@ class SearchEngine:
         
         return score
     
+    def _find_by_name(self, kind: str, name_lower: str) -> tuple[dict, ...]:
+        """Items of one knowledge type whose name contains *name_lower*."""
+        return tuple(
+            item for item in self.data.get(kind, [])
+            if name_lower in item.get("name", "").lower()
+        )
+    
     def find_schema(self, name: str) -> list[dict]:
         """Find schemas by name."""
-        name_lower = name.lower()
-        return [
-            s for s in self.data.get("schemas", [])
-            if name_lower in s.get("name", "").lower()
-        ]
+        return list(self._matches("schemas", name.lower()))
     
     def find_api(self, path: str = "", method: str = "") -> list[dict]:
         """Find API endpoints."""
@@ -159,19 +224,11 @@ class SearchEngine:
     
     def find_service(self, name: str) -> list[dict]:
         """Find services by name."""
-        name_lower = name.lower()
-        return [
-            s for s in self.data.get("services", [])
-            if name_lower in s.get("name", "").lower()
-        ]
+        return list(self._matches("services", name.lower()))
     
     def find_dependency_usage(self, name: str) -> list[dict]:
         """Find where a dependency is used."""
-        name_lower = name.lower()
-        return [
-            d for d in self.data.get("dependencies", [])
-            if name_lower in d.get("name", "").lower()
-        ]
+        return list(self._matches("dependencies", name.lower()))
     
     def get_schema_relationships(self, schema_name: str) -> dict:
         """Get all relationships for a schema."""
@@ -0,0 +1,110 @@
+"""Similarity-keyed cache for semantic query results."""
+
+import threading
+import time
+from typing import Any, Hashable
+
+import numpy as np
+
+
+class SemanticQueryCache:
+    """Cache of semantic search results, looked up by query embedding.
+
+    A lookup hits when a cached query in the same *scope* (the endpoint and
+    its filters) has cosine similarity of at least ``threshold`` with the
+    new query, so rephrasings of a recent question reuse its results.
+    Entries expire after ``ttl`` seconds; beyond ``max_entries`` the least
+    recently used entry is evicted. Safe to share between threads.
+    """
+
+    def __init__(self, threshold: float = 0.95, max_entries: int = 1024, ttl: float = 3600.0):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # Unit-length query vectors: row i belongs to entry i, rows past the
+        # entry count are spare capacity, doubled when full
+        self._vectors: np.ndarray | None = None
+        self._scopes: list[Hashable] = []
+        self._payloads: list[Any] = []
+        self._created: list[float] = []
+        self._used: list[float] = []
+
+    def get(self, scope: Hashable, vector) -> Any | None:
+        """Return the payload cached for a similar query in *scope*, or None."""
+        query = _unit(vector)
+        now = time.monotonic()
+        with self._lock:
+            if self._payloads:
+                scores = self._vectors[:len(self._payloads)] @ query
+                for i in np.argsort(scores)[::-1]:
+                    if scores[i] < self.threshold:
+                        break
+                    if self._scopes[i] == scope and now - self._created[i] <= self.ttl:
+                        self._used[i] = now
+                        self.hits += 1
+                        return self._payloads[i]
+            self.misses += 1
+            return None
+
+    def put(self, scope: Hashable, vector, payload: Any) -> None:
+        """Cache *payload* as the result of the query embedded as *vector*."""
+        query = _unit(vector)
+        now = time.monotonic()
+        with self._lock:
+            for i in reversed(range(len(self._payloads))):
+                if now - self._created[i] > self.ttl:
+                    self._remove(i)
+            if len(self._payloads) >= self.max_entries:
+                self._remove(self._used.index(min(self._used)))
+
+            n = len(self._payloads)
+            if self._vectors is None:
+                self._vectors = np.empty((min(16, self.max_entries), query.shape[0]), dtype=np.float32)
+            elif n == len(self._vectors):
+                grown = np.empty((min(2 * n, self.max_entries), query.shape[0]), dtype=np.float32)
+                grown[:n] = self._vectors
+                self._vectors = grown
+            self._vectors[n] = query
+            self._scopes.append(scope)
+            self._payloads.append(payload)
+            self._created.append(now)
+            self._used.append(now)
+
+    def clear(self) -> None:
+        """Drop every cached entry, e.g. after the index changes."""
+        with self._lock:
+            self._scopes.clear()
+            self._payloads.clear()
+            self._created.clear()
+            self._used.clear()
+
+    def stats(self) -> dict:
+        """Hit/miss counters and current size."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._payloads),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "threshold": self.threshold,
+        }
+
+    def _remove(self, i: int) -> None:
+        """Drop entry *i* by moving the last entry into its place."""
+        last = len(self._payloads) - 1
+        if i != last:
+            self._vectors[i] = self._vectors[last]
+            for entries in (self._scopes, self._payloads, self._created, self._used):
+                entries[i] = entries[last]
+        for entries in (self._scopes, self._payloads, self._created, self._used):
+            entries.pop()
+
+
+def _unit(vector) -> np.ndarray:
+    """Return *vector* as an L2-normalized float32 array."""
+    v = np.asarray(vector, dtype=np.float32)
+    norm = np.linalg.norm(v)
+    return v / norm if norm else v
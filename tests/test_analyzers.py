@@ -1,9 +1,11 @@
-"""Tests for the analyzer registry and Python analyzer."""
+"""Tests for the analyzer registry and the language analyzers."""
 
+import pickle
 from pathlib import Path
 
-from src.analyzers.base import AnalysisResult
-from src.analyzers.registry import create_default_registry
+from src.analyzers.base import AnalysisResult, Analyzer, DependencyInfo
+from src.analyzers.registry import AnalyzerRegistry, create_default_registry
+from src.extractors.python import PythonAnalyzer
 
 
 def test_create_default_registry():
@@ -44,6 +46,63 @@ class UserService:
     assert "UserService" in service_names
 
 
+def test_go_analyzer_extracts_types_routes_and_services():
+    analyzer = create_default_registry().get_analyzer("go")
+
+    source = """
+type UserStore interface {
+    Get(id int) (*User, error)
+}
+
+type User struct {
+    ID   int    `gorm:"primaryKey" json:"id"`
+    Name string `json:"name"`
+}
+
+type UserService struct {
+    store UserStore
+}
+
+func (s *UserService) Find(id int) (*User, error) {
+    return s.store.Get(id)
+}
+
+func (h *OrderHandler) List() {
+}
+
+func routes(r *gin.Engine) {
+    http.HandleFunc("/health", health)
+    r.GET("/users/:id", nil)
+}
+"""
+    result = analyzer.analyze_file(Path("svc/user.go"), source)
+
+    assert [(s.name, s.type) for s in result.schemas] == [("User", "model"), ("UserService", "type")]
+    assert [(b.name, b.type) for b in result.business_logic] == [("UserStore", "interface"), ("UserService", "service")]
+    service = result.business_logic[1]
+    assert [m["name"] for m in service.methods] == ["Find"]
+    assert service.dependencies == ["UserStore"]
+    assert [(a.method, a.path) for a in result.apis] == [("ANY", "/health"), ("GET", "/users/:id")]
+
+
+def test_config_analyzer_parses_repeated_compose_files_once(monkeypatch):
+    from src.extractors import config
+
+    loads = []
+    real_load = config.yaml.load
+    monkeypatch.setattr(config.yaml, "load", lambda *a, **k: loads.append(1) or real_load(*a, **k))
+    monkeypatch.setattr(config, "_PARSE_CACHE", type(config._PARSE_CACHE)())
+    content = "services:\n  db:\n    image: postgres:16\n"
+
+    analyzer = config.ConfigAnalyzer()
+    first = analyzer.analyze_file(Path("a/docker-compose.yml"), content)
+    second = analyzer.analyze_file(Path("b/docker-compose.yml"), content)
+
+    assert len(loads) == 1
+    assert [d.name for d in second.dependencies] == [d.name for d in first.dependencies] == ["postgres:16"]
+    assert second.dependencies[0].source_file == str(Path("b/docker-compose.yml"))
+
+
 def test_python_analyzer_handles_syntax_error():
     registry = create_default_registry()
     analyzer = registry.get_analyzer("python")
@@ -51,3 +110,116 @@ def test_python_analyzer_handles_syntax_error():
     bad_source = "def broken(:\n    pass"
     result = analyzer.analyze_file(Path("bad.py"), bad_source)
     assert len(result.errors) > 0
+
+
+def test_analyze_repository_walk_filters(tmp_path):
+    (tmp_path / "app").mkdir()
+    (tmp_path / "app" / "models.py").write_text("class Order:\n    pass\n")
+    (tmp_path / "node_modules" / "pkg").mkdir(parents=True)
+    (tmp_path / "node_modules" / "pkg" / "vendored.py").write_text("class Vendored:\n    pass\n")
+    (tmp_path / "README.md").write_text("# readme")
+    (tmp_path / "big.py").write_text("x = 1\n" * 100)
+
+    registry = create_default_registry()
+    result = registry.analyze_repository(
+        tmp_path,
+        skip_dirs=["node_modules"],
+        include_extensions=[".py"],
+        max_file_size=100,
+    )
+
+    assert result.analyzed_files == [str(Path("app") / "models.py")]
+    assert result.file_count == 1
+
+
+def test_analyze_repository_parallel_matches_serial(tmp_path):
+    for i in range(5):
+        (tmp_path / f"service_{i}.py").write_text(f"class Service{i}:\n    def run(self):\n        pass\n")
+
+    registry = create_default_registry()
+    serial = registry.analyze_repository(tmp_path)
+    parallel = registry.analyze_repository(tmp_path, workers=2)
+
+    assert parallel.analyzed_files == serial.analyzed_files
+    assert [s.name for s in parallel.business_logic] == [s.name for s in serial.business_logic]
+
+
+def test_analyze_repository_translates_crlf_newlines(tmp_path):
+    source = "from pydantic import BaseModel\n\nclass User(BaseModel):\n    name: str\n"
+    (tmp_path / "models.py").write_bytes(source.replace("\n", "\r\n").encode())
+
+    result = create_default_registry().analyze_repository(tmp_path)
+
+    definitions = [s.raw_definition for s in result.schemas if s.raw_definition]
+    assert definitions
+    assert not any("\r" in d for d in definitions)
+
+
+def test_analyze_repository_respects_analyzer_size_limit(tmp_path):
+    (tmp_path / "small.py").write_text("class Small:\n    pass\n")
+    (tmp_path / "large.py").write_text("class Large:\n    pass\n" + "# pad\n" * 50)
+
+    analyzer = PythonAnalyzer()
+    analyzer.max_file_size = 100
+    registry = AnalyzerRegistry()
+    registry.register(analyzer)
+    result = registry.analyze_repository(tmp_path)
+
+    assert result.analyzed_files == ["small.py"]
+
+
+def test_analyze_repository_skips_oversized_bundles(tmp_path):
+    padding = "// pad\n" * 50_000
+    (tmp_path / "bundle.js").write_text("export interface User { name: string }\n" + padding)
+    (tmp_path / "models.py").write_text("class User:\n    pass\n" + "# pad\n" * 50_000)
+
+    result = create_default_registry().analyze_repository(tmp_path)
+
+    assert result.analyzed_files == ["models.py"]
+
+
+class _FailingAnalyzer(Analyzer):
+    extensions = [".lock"]
+    language = "failing"
+
+    def analyze_file(self, file_path, content):
+        raise NotImplementedError
+
+    def analyze_into(self, file_path, content, result):
+        result.dependencies.append(DependencyInfo("left-pad", "1.0", "runtime", str(file_path), "npm"))
+        raise ValueError("parse error")
+
+
+def test_failed_analyzer_output_is_discarded():
+    for cache_bytes in (0, 1 << 20):
+        registry = AnalyzerRegistry(result_cache_bytes=cache_bytes)
+        registry.register(_FailingAnalyzer())
+
+        result = registry.analyze_file(Path("a/deps.lock"), "left-pad 1.0")
+
+        assert result.dependencies == []
+        assert result.errors == ["failing: parse error"]
+
+
+def test_analyze_file_reuses_results_for_identical_content():
+    registry = create_default_registry(result_cache_bytes=1 << 20)
+    content = "from pydantic import BaseModel\n\nclass User(BaseModel):\n    name: str\n"
+
+    first = registry.analyze_file(Path("a/models.py"), content)
+    first.schemas[0].description = "annotated"
+    second = registry.analyze_file(Path("b/models.py"), content)
+
+    assert len(registry._result_cache) == 1
+    assert [s.name for s in second.schemas] == [s.name for s in first.schemas]
+    assert {s.source_file for s in second.schemas} == {str(Path("b/models.py"))}
+    assert second.schemas[0].description is None
+    assert pickle.loads(pickle.dumps(registry))._result_cache == {}
+
+
+def test_result_cache_is_off_by_default():
+    registry = create_default_registry()
+    content = "from pydantic import BaseModel\n\nclass User(BaseModel):\n    name: str\n"
+
+    registry.analyze_file(Path("a/models.py"), content)
+
+    assert not registry._result_cache
@@ -0,0 +1,66 @@
+"""Tests for the background crawl job state."""
+
+import asyncio
+import threading
+
+from src.api.crawl_manager import CrawlJob, CrawlManager
+
+
+def test_to_dict_reuses_cached_dict_until_change():
+    job = CrawlJob(job_id="abc")
+    first = job.to_dict()
+    assert job.to_dict() is first
+
+    job.status = "running"
+    second = job.to_dict()
+    assert second is not first
+    assert second["status"] == "running"
+
+
+def test_append_log_invalidates_cached_dict():
+    job = CrawlJob(job_id="abc")
+    before = job.to_dict()
+
+    job.append_log("[00:00:00] hello")
+    after = job.to_dict()
+    assert after is not before
+    assert after["log"] == ["[00:00:00] hello"]
+
+
+def test_is_running_recovers_when_pipeline_exits_without_status():
+    class ExitingManager(CrawlManager):
+        def _execute_pipeline(self):
+            return  # exits without marking the job completed or failed
+
+    manager = ExitingManager(config_path="missing.yaml")
+    manager.start()
+    manager._thread.join(timeout=5)
+
+    assert manager.is_running() is False
+    assert manager.get_status()["status"] == "failed"
+
+
+def test_field_change_reuses_log_snapshot():
+    job = CrawlJob(job_id="abc")
+    job.append_log("line")
+    before = job.to_dict()
+
+    job.stage_detail = "working"
+    after = job.to_dict()
+    assert after is not before
+    assert after["log"] is before["log"]
+
+
+def test_wait_for_change_wakes_on_log_from_another_thread():
+    manager = CrawlManager(config_path="missing.yaml")
+    seen = manager.changes
+
+    async def wait():
+        timer = threading.Timer(0.05, manager._log, args=("hello",))
+        timer.start()
+        changes = await manager.wait_for_change(seen, timeout=5)
+        timer.join()
+        return changes
+
+    assert asyncio.run(wait()) == seen + 1
+    assert asyncio.run(manager.wait_for_change(seen + 1, timeout=0.01)) == seen + 1
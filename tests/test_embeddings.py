@@ -0,0 +1,207 @@
+"""Tests for semantic search helpers that do not need a model."""
+
+import gc
+import json
+import threading
+import time
+import weakref
+
+import pytest
+
+from src.query.embeddings import INDEX_BATCH_SIZE, SemanticSearch
+
+
+class _SlowModel:
+    def __init__(self):
+        self.batches = []
+
+    def encode(self, texts):
+        self.batches.append(list(texts))
+        time.sleep(0.05)
+        return [[3.0, float(len(t))] for t in texts]
+
+
+def _unit(vector):
+    norm = sum(x * x for x in vector) ** 0.5
+    return [x / norm for x in vector]
+
+
+def test_concurrent_embeds_share_model_calls(tmp_path):
+    pytest.importorskip("numpy")
+    search = SemanticSearch(persist_dir=tmp_path)
+    model = search._model = _SlowModel()
+    texts = [f"query {'x' * i}" for i in range(6)]
+    results = {}
+
+    def embed(text):
+        results[text] = search.embed(text)
+
+    threads = [threading.Thread(target=embed, args=(t,)) for t in texts]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    for t in texts:
+        assert results[t].tolist() == pytest.approx(_unit([3.0, float(len(t))]))
+    assert len(model.batches) < len(texts)
+
+
+def test_repeated_query_is_embedded_once(tmp_path):
+    pytest.importorskip("numpy")
+    search = SemanticSearch(persist_dir=tmp_path)
+    model = search._model = _SlowModel()
+
+    first = search.embed("orders by customer")
+    second = search.embed("orders by customer")
+
+    assert second is first
+    assert not first.flags.writeable
+    assert model.batches == [["orders by customer"]]
+
+
+
+def test_discarded_search_is_freed_and_stops_batcher_threads(tmp_path):
+    pytest.importorskip("numpy")
+    search = SemanticSearch(persist_dir=tmp_path)
+    search._model = _SlowModel()
+    search.embed("orders by customer")
+    thread = search._embed_batcher._thread
+    ref = weakref.ref(search)
+
+    # Freed by reference counting alone, as the server freezes the heap
+    gc.disable()
+    gc.freeze()
+    try:
+        del search
+        deadline = time.monotonic() + 1
+        while ref() is not None and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        gc.unfreeze()
+        gc.enable()
+
+    assert ref() is None
+    thread.join(timeout=1)
+    assert not thread.is_alive()
+
+
+class _Vectors(list):
+    def tolist(self):
+        return list(self)
+
+
+class _BatchModel:
+    def encode(self, texts, **kwargs):
+        return _Vectors([1.0, 0.0] for _ in texts)
+
+
+class _Collection:
+    def __init__(self):
+        self.ids = []
+
+    def upsert(self, ids, **kwargs):
+        self.ids += ids
+
+
+def test_index_chunks_reports_progress(tmp_path):
+    chunks = [{"id": f"c{i}", "text": f"chunk {i}"} for i in range(INDEX_BATCH_SIZE + 6)]
+    chunks_path = tmp_path / "chunks.json"
+    chunks_path.write_text(json.dumps(chunks))
+    search = SemanticSearch(persist_dir=tmp_path / "chroma")
+    search._model = _BatchModel()
+    search._collection = _Collection()
+    reports = []
+
+    indexed = search.index_chunks(chunks_path, progress=lambda done, total: reports.append((done, total)))
+
+    assert indexed == len(chunks)
+    assert reports == [(INDEX_BATCH_SIZE, len(chunks)), (len(chunks), len(chunks))]
+    assert len(search._collection.ids) == len(chunks)
+
+
+class _SlowCollection:
+    def __init__(self):
+        self.calls = []
+
+    def query(self, query_embeddings, n_results, where, include):
+        self.calls.append((len(query_embeddings), n_results, where))
+        time.sleep(0.05)
+        ids = [[f"{where and where.get('type')}-{e[0]:g}-{k}" for k in range(n_results)] for e in query_embeddings]
+        return {
+            "ids": ids,
+            "distances": [[0.1] * n_results for _ in query_embeddings],
+            "documents": [["doc"] * n_results for _ in query_embeddings],
+            "metadatas": [[{}] * n_results for _ in query_embeddings],
+        }
+
+
+def test_concurrent_searches_share_collection_queries(tmp_path):
+    search = SemanticSearch(persist_dir=tmp_path)
+    collection = search._collection = _SlowCollection()
+    requests = [(float(i), 1 + i % 3, "schema" if i % 2 else None) for i in range(8)]
+    results = {}
+
+    def run(embedding, limit, type_filter):
+        found = search.search("q", limit=limit, type_filter=type_filter, query_embedding=[embedding])
+        results[embedding] = [r["id"] for r in found]
+
+    threads = [threading.Thread(target=run, args=r) for r in requests]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    for embedding, limit, type_filter in requests:
+        assert results[embedding] == [f"{type_filter}-{embedding:g}-{k}" for k in range(limit)]
+    assert len(collection.calls) < len(requests)
+
+
+class _PartlyBrokenCollection(_SlowCollection):
+    def query(self, query_embeddings, n_results, where, include):
+        if where == {"type": "broken"}:
+            raise ValueError("bad filter")
+        return super().query(query_embeddings, n_results, where, include)
+
+
+def test_failed_filter_query_only_fails_its_own_requests(tmp_path):
+    search = SemanticSearch(persist_dir=tmp_path)
+    search._collection = _PartlyBrokenCollection()
+    outcomes = {}
+
+    def run(embedding, type_filter):
+        try:
+            found = search.search("q", limit=1, type_filter=type_filter, query_embedding=[embedding])
+            outcomes[embedding] = [r["id"] for r in found]
+        except ValueError as e:
+            outcomes[embedding] = str(e)
+
+    threads = [
+        threading.Thread(target=run, args=(float(i), "broken" if i % 2 else "schema"))
+        for i in range(6)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    for i in range(6):
+        assert outcomes[float(i)] == ("bad filter" if i % 2 else [f"schema-{i}-0"])
+
+
+class _RepoCollection(_SlowCollection):
+    def get(self, include, limit, offset):
+        metadatas = [{"repo": "billing-api"}, {"repo": "billing-web"}, {"repo": "accounts"}, {}]
+        return {"metadatas": metadatas[offset:offset + limit]}
+
+
+def test_repo_filter_resolves_to_matching_repo_names(tmp_path):
+    search = SemanticSearch(persist_dir=tmp_path)
+    collection = search._collection = _RepoCollection()
+
+    search.search("q", type_filter="api", repo_filter="billing", query_embedding=[1.0])
+    assert search.search("q", repo_filter="shipping", query_embedding=[1.0]) == []
+
+    assert collection.calls == [
+        (1, 10, {"$and": [{"type": "api"}, {"repo": {"$in": ["billing-api", "billing-web"]}}]}),
+    ]
@@ -0,0 +1,131 @@
+"""Tests for the knowledge-base filter indexes."""
+
+from src.query.index import KBIndex
+
+
+def _kb():
+    return {
+        "schemas": [
+            {"name": "User", "type": "model", "repo": "accounts"},
+            {"name": "UserProfile", "type": "table", "repo": "accounts"},
+            {"name": "Order", "type": "model", "repo": "shop"},
+        ],
+        "apis": [
+            {"path": "/api/users", "method": "get", "repo": "accounts"},
+            {"path": "/api/users", "method": "POST", "repo": "accounts"},
+        ],
+        "dependencies": [
+            {"name": "fastapi", "ecosystem": "pip"},
+            {"name": "express", "ecosystem": "npm"},
+        ],
+    }
+
+
+def test_find_schemas_combines_filters():
+    index = KBIndex(_kb())
+
+    assert [s["name"] for s in index.find_schemas(name="user")] == ["User", "UserProfile"]
+    assert [s["name"] for s in index.find_schemas(name="USER", type="model")] == ["User"]
+    assert [s["name"] for s in index.find_schemas(type="model", repo="SHOP")] == ["Order"]
+    assert list(index.find_schemas(type="view")) == []
+
+
+def test_find_apis_matches_method_case_insensitively():
+    index = KBIndex(_kb())
+
+    assert [a["method"] for a in index.find_apis(method="GET")] == ["get"]
+    assert len(list(index.find_apis(path="USERS"))) == 2
+    assert [a["method"] for a in index.find_apis(method="post", repo="ACC")] == ["POST"]
+    assert list(index.find_apis(method="DELETE")) == []
+
+
+def test_find_dependencies_by_ecosystem():
+    index = KBIndex(_kb())
+
+    assert [d["name"] for d in index.find_dependencies(ecosystem="npm")] == ["express"]
+    assert list(index.find_services()) == []
+
+
+def test_find_unique_dependencies_keeps_first_per_name():
+    kb = {
+        "dependencies": [
+            {"name": "requests", "ecosystem": "pip", "repo": "a"},
+            {"name": "lodash", "ecosystem": "npm", "repo": "b"},
+            {"name": "requests", "ecosystem": "pip", "repo": "c"},
+            {"name": "lodash", "ecosystem": "bower", "repo": "d"},
+        ],
+    }
+    index = KBIndex(kb)
+
+    assert [d["repo"] for d in index.find_unique_dependencies()] == ["a", "b"]
+    assert [d["repo"] for d in index.find_unique_dependencies(ecosystem="bower")] == ["d"]
+    assert [d["repo"] for d in index.find_unique_dependencies(name="REQ")] == ["a"]
+
+
+def test_substring_filters_agree_with_plain_scan():
+    names = [f"{prefix}{i}Service" for i in range(300) for prefix in ("Order", "User", "Invoice")]
+    kb = {"schemas": [{"name": name, "type": "model", "repo": "shop"} for name in names]}
+    index = KBIndex(kb)
+
+    for needle in ("o", "rs", "user1", "INVOICE29", "ice2", "nomatch", "service"):
+        expected = [name for name in names if needle.lower() in name.lower()]
+        assert [s["name"] for s in index.find_schemas(name=needle)] == expected
+
+
+def test_relationship_lookups_match_search_engine(sample_kb_json):
+    from src.query.search import SearchEngine
+
+    engine = SearchEngine(kb_path=sample_kb_json)
+    engine.data["schemas"].append(
+        {"name": "Order", "relationships": [{"type": "belongs_to", "target": "user", "field": "user_id"}]}
+    )
+    engine.data["services"].append({"name": "BillingService", "dependencies": ["userservice"]})
+    index = KBIndex(engine.data)
+
+    for name in ("user", "Order", "missing"):
+        assert index.schema_relationships(name) == engine.get_schema_relationships(name)
+    for name in ("UserService", "billing", "missing"):
+        assert index.service_dependencies(name) == engine.get_service_dependencies(name)
+
+
+def test_matching_recipes_by_question_words():
+    kb = {
+        "semantic_layers": [
+            {"query_recipes": [{"question": "How many orders shipped?"}, {"question": "Who are our users?"}]},
+            {"query_recipes": [{"question": "Which ORDER is oldest?"}, {"question": "What was refunded?"}]},
+        ],
+    }
+    index = KBIndex(kb)
+
+    questions = [r["question"] for r in index.matching_recipes("order count for each user")]
+    assert questions == ["How many orders shipped?", "Who are our users?", "Which ORDER is oldest?"]
+    assert [r["question"] for r in index.matching_recipes("users", limit=1)] == ["Who are our users?"]
+    # Words of three letters or fewer are ignored
+    assert index.matching_recipes("who was it") == []
+
+
+def test_find_recipes_and_glossary_tag_repo():
+    kb = {
+        "semantic_layers": [
+            {
+                "repo_name": "Shop",
+                "query_recipes": [{"question": "How many orders shipped?"}],
+                "business_glossary": [{"term": "Order", "repo": "stale"}],
+            },
+            {"repo_name": "accounts", "query_recipes": [{"question": "How many users?"}]},
+        ],
+    }
+    index = KBIndex(kb)
+
+    assert index.glossary == [{"term": "Order", "repo": "Shop"}]
+
+    assert [r["repo"] for r in index.find_recipes(question="HOW MANY")] == ["Shop", "accounts"]
+    assert [r["question"] for r in index.find_recipes(repo="shop")] == ["How many orders shipped?"]
+    assert index.semantic_layers_by_repo["shop"]["repo_name"] == "Shop"
+
+
+def test_contexts_by_repo_keeps_first_per_name():
+    index = KBIndex({"contexts": [{"repo_name": "Shop", "purpose": "a"}, {"repo_name": "shop", "purpose": "b"}]})
+
+    assert index.contexts_by_repo["shop"]["purpose"] == "a"
+    assert "accounts" not in index.contexts_by_repo
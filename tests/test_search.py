@@ -56,3 +56,33 @@ def test_search_no_results(sample_kb_json):
     engine = SearchEngine(kb_path=sample_kb_json)
     results = engine.search("zzz_nonexistent_zzz")
     assert results == []
+
+
+def test_load_writes_and_reuses_pickle_cache(sample_kb_json):
+    engine = SearchEngine(kb_path=sample_kb_json)
+    cache_path = sample_kb_json.with_name(sample_kb_json.name + ".pkl")
+    assert cache_path.exists()
+
+    cached = SearchEngine(kb_path=sample_kb_json)
+    assert cached.data == engine.data
+
+
+def test_load_ignores_stale_pickle_cache(sample_kb_json):
+    import json
+
+    SearchEngine(kb_path=sample_kb_json)
+    data = json.loads(sample_kb_json.read_text())
+    data["schemas"][0]["name"] = "Account"
+    sample_kb_json.write_text(json.dumps(data, indent=4))
+
+    engine = SearchEngine(kb_path=sample_kb_json)
+    assert engine.find_schema("Account")
+
+
+def test_repeated_search_is_served_from_cache(sample_kb_json):
+    engine = SearchEngine(kb_path=sample_kb_json)
+    first = engine.search("User", limit=5)
+    first.clear()
+
+    assert engine.search("user", limit=1) == engine.search("USER")[:1]
+    assert engine._ranked.cache_info().hits == 2
@@ -0,0 +1,56 @@
+"""Tests for the semantic query cache."""
+
+import time
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.query.semantic_cache import SemanticQueryCache
+
+
+def test_similar_query_in_same_scope_hits():
+    cache = SemanticQueryCache(threshold=0.95)
+    cache.put(("search", None), [1.0, 0.0, 0.0], ["result"])
+
+    assert cache.get(("search", None), [0.99, 0.05, 0.0]) == ["result"]
+    assert cache.get(("search", "schema"), [1.0, 0.0, 0.0]) is None
+    assert cache.get(("search", None), [0.0, 1.0, 0.0]) is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 2
+
+
+def test_evicts_least_recently_used():
+    cache = SemanticQueryCache(max_entries=2)
+    cache.put("s", [1.0, 0.0], "a")
+    cache.put("s", [0.0, 1.0], "b")
+    cache.get("s", [1.0, 0.0])
+    cache.put("s", [-1.0, 0.0], "c")
+
+    assert cache.get("s", [1.0, 0.0]) == "a"
+    assert cache.get("s", [0.0, 1.0]) is None
+    assert cache.stats()["entries"] == 2
+
+
+def test_expired_entries_miss():
+    cache = SemanticQueryCache(ttl=0.0)
+    cache.put("s", [1.0, 0.0], "a")
+    time.sleep(0.01)
+
+    assert cache.get("s", [1.0, 0.0]) is None
+
+
+def test_entries_survive_growth_and_removal():
+    cache = SemanticQueryCache(threshold=0.9999, max_entries=40)
+    angles = np.linspace(0, np.pi / 2, 40)
+    for i, angle in enumerate(angles):
+        cache.put("s", [np.cos(angle), np.sin(angle)], i)
+    cache.get("s", [np.cos(angles[0]), np.sin(angles[0])])
+    # Full: evicts entry 1, the least recently used, and moves the last entry into its row
+    cache.put("s", [-1.0, 0.0], "new")
+
+    assert cache.stats()["entries"] == 40
+    assert cache.get("s", [np.cos(angles[1]), np.sin(angles[1])]) is None
+    for i in (0, 2, 39):
+        assert cache.get("s", [np.cos(angles[i]), np.sin(angles[i])]) == i
+    assert cache.get("s", [-1.0, 0.0]) == "new"